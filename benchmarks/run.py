@@ -0,0 +1,307 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time every hook on a synthetic repository and compare against a baseline.
+
+Example::
+
+    python benchmarks/run.py --files 30000 --output results.json \\
+        --baseline baseline.json --threshold 0.2
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import synthetic
+
+Metrics = Dict[str, float]
+
+
+def run_hook(
+    hook: str, args: List[str], filenames: List[str], phases: Optional[Metrics] = None
+) -> float:
+    """Run ``hook`` end to end in a new interpreter, like pre-commit does.
+
+    Exit status 1, which only means that the hook found problems, is fine;
+    any other failure means that the hook did not really run. If ``phases``
+    is given, the time of each timer that the hook reports with
+    ``--stats-json`` is added to it.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = os.path.join(tmp, "stats.json")
+        if phases is not None:
+            args = [*args, "--stats-json", stats]
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "rapids_pre_commit_hooks", hook, *args, *filenames],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode not in (0, 1):
+            raise RuntimeError(
+                f"{hook} exited with status {result.returncode}:\n{result.stderr}"
+            )
+        if phases is not None:
+            with open(stats) as f:
+                for name, timer in json.load(f)["timers"].items():
+                    phases[name] = timer["seconds"]
+    return elapsed
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time of ``module`` as reported by ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    ).stderr
+    for line in reversed(stderr.splitlines()):
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1e6
+    raise ValueError(f"no import time reported for {module}")
+
+
+def bench_end_to_end(
+    hook: str,
+    module: str,
+    cached: bool = True,
+    fixes: bool = False,
+    setup: Optional[Callable[[List[str]], List[str]]] = None,
+) -> Callable[[List[str]], Metrics]:
+    """Benchmark of a hook end to end, and of each phase that it times.
+
+    Phases are taken from the timers of the first run, such as ``git``,
+    ``read`` and ``match``. Hooks that keep no cache, and so take no
+    ``--no-cache``, are only timed once rather than cold and with a warm
+    cache. Hooks that ``fixes`` files are then run once more with ``--fix``,
+    which the ``fix`` phase is taken from. ``setup`` adds the files that a
+    hook checks to the repository, and returns them to be passed to the hook
+    instead of the repository's files.
+    """
+
+    def bench(filenames: List[str]) -> Metrics:
+        from rapids_pre_commit_hooks import git
+
+        if setup is not None:
+            filenames = setup(filenames)
+        metrics: Metrics = {"import": import_time(module)}
+        if not cached:
+            metrics["end_to_end"] = run_hook(hook, [], filenames, metrics)
+            return metrics
+        cache_dir = os.path.join(git.git_dir(), "rapids-pre-commit-hooks")
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        metrics["end_to_end"] = run_hook(hook, ["--no-cache"], filenames, metrics)
+        run_hook(hook, [], filenames)
+        metrics["end_to_end_cached"] = run_hook(hook, [], filenames)
+        if fixes:
+            phases: Metrics = {}
+            metrics["end_to_end_fix"] = run_hook(
+                hook, ["--fix", "--no-cache"], filenames, phases
+            )
+            metrics["fix"] = phases.get("fix", 0.0)
+        return metrics
+
+    return bench
+
+
+# Hook name -> benchmark, run in the root of a freshly generated repository
+BENCHMARKS: Dict[str, Callable[[List[str]], Metrics]] = {
+    # One output for every 100 files of the repository
+    "check-dependencies": bench_end_to_end(
+        "check-dependencies",
+        "rapids_pre_commit_hooks.dependencies",
+        setup=lambda filenames: synthetic.dependency_files(
+            ".", max(1, len(filenames) // 100)
+        ),
+    ),
+    "check-file-modes": bench_end_to_end(
+        "check-file-modes", "rapids_pre_commit_hooks.file_modes", cached=False
+    ),
+    "check-large-blobs": bench_end_to_end(
+        "check-large-blobs", "rapids_pre_commit_hooks.large_blobs", cached=False
+    ),
+    # One package, with three manifests, for every 30 files of the repository
+    "check-versions": bench_end_to_end(
+        "check-versions",
+        "rapids_pre_commit_hooks.versions",
+        cached=False,
+        setup=lambda filenames: synthetic.manifest_files(
+            ".", max(1, len(filenames) // 30)
+        ),
+    ),
+    "copyright-checker": bench_end_to_end(
+        "copyright-checker", "rapids_pre_commit_hooks.copyright", fixes=True
+    ),
+    "license-header-checker": bench_end_to_end(
+        "license-header-checker", "rapids_pre_commit_hooks.license_header"
+    ),
+    "rapids-check": bench_end_to_end(
+        "rapids-check", "rapids_pre_commit_hooks.pipeline", fixes=True
+    ),
+}
+
+
+def compare(
+    results: Dict[str, Metrics],
+    baseline: Dict[str, Metrics],
+    threshold: float,
+    min_delta: float,
+) -> List[str]:
+    """Describe every metric that got slower than the baseline allows."""
+    regressions = []
+    for hook, metrics in sorted(results.items()):
+        for name, value in sorted(metrics.items()):
+            base = baseline.get(hook, {}).get(name)
+            if base is None:
+                continue
+            if value > base * (1 + threshold) and value - base > min_delta:
+                regressions.append(
+                    f"{hook} {name}: {value:.3f}s vs. {base:.3f}s "
+                    f"(+{(value / max(base, 1e-9) - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = synthetic.RepoSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=defaults.files)
+    parser.add_argument("--history-depth", type=int, default=defaults.history_depth)
+    parser.add_argument("--churn", type=float, default=defaults.churn)
+    parser.add_argument("--median-size", type=int, default=defaults.median_size)
+    parser.add_argument("--size-sigma", type=float, default=defaults.size_sigma)
+    parser.add_argument("--max-size", type=int, default=defaults.max_size)
+    parser.add_argument(
+        "--header-mix",
+        type=synthetic.RepoSpec.parse_header_mix,
+        default=defaults.header_mix,
+        metavar="STATE=WEIGHT,...",
+        help="relative weights of header states "
+        f"({', '.join(synthetic.HEADER_STATES)})",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=defaults.year,
+        help="year that the history ends in (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--hook",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="hook to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="run each benchmark this many times and keep the fastest",
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown that counts as a regression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.01,
+        metavar="SECONDS",
+        help="ignore slowdowns smaller than this (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    spec = synthetic.RepoSpec(
+        files=args.files,
+        history_depth=args.history_depth,
+        churn=args.churn,
+        median_size=args.median_size,
+        size_sigma=args.size_sigma,
+        max_size=args.max_size,
+        header_mix=args.header_mix,
+        seed=args.seed,
+        year=args.year,
+    )
+    # Hooks run in the generated repository, where a relative path would no
+    # longer point at the package under test.
+    if os.environ.get("PYTHONPATH"):
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            os.path.abspath(p) for p in os.environ["PYTHONPATH"].split(os.pathsep)
+        )
+    results: Dict[str, Metrics] = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = os.path.join(tmp, "repo")
+        filenames = synthetic.generate(repo, spec)
+        for hook in args.hook or sorted(BENCHMARKS):
+            for _ in range(args.repeat):
+                # Fixes change the repository, so start every run afresh.
+                subprocess.run(["git", "reset", "-q", "--hard"], cwd=repo, check=True)
+                os.chdir(repo)
+                try:
+                    metrics = BENCHMARKS[hook](filenames)
+                finally:
+                    os.chdir(cwd)
+                best = results.setdefault(hook, metrics)
+                for name, value in metrics.items():
+                    best[name] = min(best[name], value)
+
+    for hook, metrics in sorted(results.items()):
+        for name, value in sorted(metrics.items()):
+            print(f"{hook:24} {name:20} {value:9.3f}s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "spec": dataclasses.asdict(spec),
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reproducible synthetic git repositories for benchmarking hooks."""
+
+import dataclasses
+import datetime
+import os
+import posixpath
+import random
+import subprocess
+import time
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+import yaml
+
+SUFFIXES = [".py", ".cpp", ".cu", ".hpp", ".cmake", ".yaml", ".sh", ".toml"]
+COMMENTS = {
+    ".py": "#",
+    ".cpp": "//",
+    ".cu": "//",
+    ".hpp": "//",
+    ".cmake": "#",
+    ".yaml": "#",
+    ".sh": "#",
+    ".toml": "#",
+}
+HEADER_STATES = ("current", "stale", "missing", "third_party")
+
+
+@dataclasses.dataclass
+class RepoSpec:
+    files: int = 1000
+    history_depth: int = 50
+    # Fraction of files changed by each commit after the first
+    churn: float = 0.02
+    # File sizes follow a log-normal distribution, capped at max_size.
+    median_size: int = 4096
+    size_sigma: float = 1.5
+    max_size: int = 16 * 1024 * 1024
+    header_mix: Dict[str, float] = dataclasses.field(
+        default_factory=lambda: {
+            "current": 0.6,
+            "stale": 0.3,
+            "missing": 0.05,
+            "third_party": 0.05,
+        }
+    )
+    seed: int = 0
+    # Header years and commit dates are relative to this year rather than
+    # today's, so that a spec produces the same repository in any year.
+    year: int = 2025
+
+    @classmethod
+    def parse_header_mix(cls, value: str) -> Dict[str, float]:
+        """Parse ``state=weight,...`` into a header mix."""
+        mix = {}
+        for item in value.split(","):
+            state, _, weight = item.partition("=")
+            if state not in HEADER_STATES:
+                raise ValueError(f"unknown header state: {state}")
+            mix[state] = float(weight)
+        return mix
+
+
+def _header(state: str, comment: str, year: int) -> str:
+    if state == "current":
+        return f"{comment} Copyright (c) {year - 3}-{year}, NVIDIA CORPORATION.\n"
+    if state == "stale":
+        return f"{comment} Copyright (c) {year - 5}, NVIDIA CORPORATION.\n"
+    if state == "third_party":
+        return f"{comment} Copyright {year - 10} The Example Authors\n"
+    return ""
+
+
+def _body(size: int, comment: str) -> str:
+    line = f"{comment} " + "x" * 70 + "\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def _commit(
+    stream: BinaryIO, n: int, timestamp: int, files: Iterator[Tuple[str, bytes]]
+) -> None:
+    message = b"commit %d" % n
+    stream.write(b"commit refs/heads/main\n")
+    stream.write(b"committer Bench <bench@example.com> %d +0000\n" % timestamp)
+    stream.write(b"data %d\n%s\n" % (len(message), message))
+    for path, content in files:
+        stream.write(b"M 100644 inline %s\n" % path.encode())
+        stream.write(b"data %d\n%s\n" % (len(content), content))
+
+
+def generate(path: str, spec: RepoSpec) -> List[str]:
+    """Create a repository at ``path`` and return the paths of its files.
+
+    The same ``spec`` always produces the same history and content. The
+    history is streamed into ``git fast-import``, so even large repositories
+    are created quickly and without holding their content in memory.
+    """
+    rng = random.Random(spec.seed)
+    year = spec.year
+    states = list(spec.header_mix)
+    weights = [spec.header_mix[s] for s in states]
+
+    filenames = []
+    for i in range(spec.files):
+        suffix = rng.choice(SUFFIXES)
+        filenames.append(f"dir{i % 97:02d}/sub{i % 13:02d}/file{i:06d}{suffix}")
+
+    def contents(filenames: List[str]) -> Iterator[Tuple[str, bytes]]:
+        for filename in filenames:
+            comment = COMMENTS[posixpath.splitext(filename)[1]]
+            state = rng.choices(states, weights)[0]
+            size = int(rng.lognormvariate(0, spec.size_sigma) * spec.median_size)
+            text = _header(state, comment, year) + _body(
+                min(size, spec.max_size), comment
+            )
+            yield filename, text.encode()
+
+    # Spread the history evenly over the five years before the reference one.
+    end = int(datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    start = end - 5 * 365 * 24 * 3600
+    step = (end - start) // max(1, spec.history_depth)
+
+    subprocess.run(["git", "init", "-q", path], check=True)
+    with subprocess.Popen(
+        ["git", "fast-import", "--quiet"], stdin=subprocess.PIPE, cwd=path
+    ) as proc:
+        assert proc.stdin is not None
+        _commit(proc.stdin, 0, start, contents(filenames))
+        for n in range(1, spec.history_depth):
+            changed = rng.sample(filenames, max(1, int(spec.files * spec.churn)))
+            _commit(proc.stdin, n, start + n * step, contents(sorted(changed)))
+        proc.stdin.close()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    subprocess.run(
+        ["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=path, check=True
+    )
+    subprocess.run(["git", "reset", "-q", "--hard"], cwd=path, check=True)
+    # Files written in the same second as the index are "racily clean", and
+    # git re-reads them on every status check. Refresh the index once their
+    # timestamps are in the past, so that runs are not slowed down by that.
+    time.sleep(1)
+    subprocess.run(["git", "update-index", "-q", "--refresh"], cwd=path)
+    return filenames
+
+
+def _write(path: str, files: Dict[str, str]) -> List[str]:
+    """Write and stage ``files``, keyed by their path within ``path``."""
+    for filename, text in files.items():
+        os.makedirs(os.path.join(path, posixpath.dirname(filename)), exist_ok=True)
+        with open(os.path.join(path, filename), "w") as f:
+            f.write(text)
+    subprocess.run(["git", "add", "--", *files], cwd=path, check=True)
+    return sorted(files)
+
+
+def dependency_files(path: str, outputs: int) -> List[str]:
+    """Write a ``dependencies.yaml`` with ``outputs`` entries under ``files``,
+    and the conda environments and ``pyproject.toml`` tables generated from
+    it, all in agreement.
+    """
+    cuda = ["11.8", "12.0"]
+    channels = ["rapidsai", "conda-forge"]
+    common = [f"common-{i}" for i in range(20)]
+    config: Dict[str, Dict] = {"files": {}, "channels": channels, "dependencies": {}}
+    files = {}
+    for i in range(outputs):
+        packages = [f"pkg{i}-dep-{j}" for j in range(10)]
+        config["files"][f"env{i}"] = {
+            "output": ["conda", "pyproject"],
+            "matrix": {"cuda": cuda},
+            "includes": ["common", f"deps{i}"],
+            "pyproject_dir": f"python/pkg{i}",
+        }
+        config["dependencies"][f"deps{i}"] = {
+            "common": [{"output_types": ["conda", "pyproject"], "packages": packages}]
+        }
+        for version in cuda:
+            name = f"env{i}_cuda-{version.replace('.', '')}.yaml"
+            files[f"conda/environments/{name}"] = yaml.safe_dump(
+                {"channels": channels, "dependencies": common + packages}
+            )
+        lines = "".join(f'    "{p}",\n' for p in common + packages)
+        files[f"python/pkg{i}/pyproject.toml"] = (
+            f'[project]\nname = "pkg{i}"\nversion = "24.2.0"\n'
+            f"dependencies = [\n{lines}]\n"
+        )
+    config["dependencies"]["common"] = {
+        "common": [{"output_types": ["conda", "pyproject"], "packages": common}]
+    }
+    files["dependencies.yaml"] = yaml.safe_dump(config)
+    return _write(path, files)
+
+
+def manifest_files(path: str, packages: int) -> List[str]:
+    """Write a ``VERSION`` file and, for each of ``packages``, a
+    ``pyproject.toml``, a conda recipe and a ``CMakeLists.txt``, all of the
+    same version.
+    """
+    files = {"VERSION": "24.02.00\n"}
+    for i in range(packages):
+        files[f"python/lib{i}/pyproject.toml"] = (
+            '[build-system]\nrequires = ["setuptools"]\n\n'
+            f'[project]\nname = "lib{i}"\nversion = "24.2.0"\n'
+        )
+        files[f"conda/recipes/lib{i}/meta.yaml"] = (
+            '{% set version = "24.02" %}\n\n'
+            f"package:\n  name: lib{i}\n  version: {{{{ version }}}}\n\n"
+            "source:\n  path: ../../..\n"
+        )
+        files[f"cpp/lib{i}/CMakeLists.txt"] = (
+            "cmake_minimum_required(VERSION 3.26)\n"
+            f"project(\n  LIB{i}\n  VERSION 24.02.00\n  LANGUAGES CXX CUDA)\n"
+        )
+    return _write(path, files)
@@ -0,0 +1,136 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import os
+import sqlite3
+import subprocess
+import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from . import git
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+# (blob OID, checker name and version, config hash)
+CacheKey = Tuple[str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    oid TEXT NOT NULL,
+    checker TEXT NOT NULL,
+    config TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    atime INTEGER NOT NULL,
+    PRIMARY KEY (oid, checker, config)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS verdicts_atime ON verdicts (atime);
+"""
+
+
+def default_path() -> str:
+    return os.path.join(git.git_dir(), "rapids-pre-commit-hooks", "cache.sqlite3")
+
+
+class VerdictCache:
+    """Content-addressed store of checker verdicts.
+
+    Entries are keyed by the git blob OID of the checked content, so a file is
+    never opened when its blob has been seen before. The database lives in a
+    SQLite file in WAL mode, which lets concurrent hook processes read while
+    one of them writes. Once the store grows past ``max_entries``, the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "VerdictCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    # A cache failure, such as a lock held for longer than the timeout, must
+    # never fail the hook, so lookups and stores degrade to misses and no-ops.
+
+    def get_many(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, str]:
+        found = {}
+        try:
+            for key in keys:
+                row = self._db.execute(
+                    "SELECT verdict FROM verdicts "
+                    "WHERE oid=? AND checker=? AND config=?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    found[key] = row[0]
+            if found:
+                now = time.time_ns()
+                with self._transaction() as db:
+                    db.executemany(
+                        "UPDATE verdicts SET atime=? "
+                        "WHERE oid=? AND checker=? AND config=?",
+                        ((now, *key) for key in found),
+                    )
+        except sqlite3.Error:
+            pass
+        return found
+
+    def put_many(self, items: Iterable[Tuple[CacheKey, str]]) -> None:
+        with contextlib.suppress(sqlite3.Error):
+            self._put_many(items)
+
+    def _put_many(self, items: Iterable[Tuple[CacheKey, str]]) -> None:
+        now = time.time_ns()
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+                ((*key, verdict, now) for key, verdict in items),
+            )
+            (count,) = db.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+            if count > self.max_entries:
+                db.execute(
+                    "DELETE FROM verdicts WHERE (oid, checker, config) IN ("
+                    "SELECT oid, checker, config FROM verdicts ORDER BY atime LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+
+def open_cache(
+    path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> Optional[VerdictCache]:
+    """Open the verdict cache, or return ``None`` if it is unavailable."""
+    try:
+        return VerdictCache(path or default_path(), max_entries)
+    except (OSError, sqlite3.Error, subprocess.CalledProcessError):
+        return None
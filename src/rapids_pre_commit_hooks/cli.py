@@ -0,0 +1,152 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Console script entry points. Each one imports the module of its own hook,
+# and only once it is clear that no daemon will run the hook instead, so the
+# imports here must stay cheap.
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Hook name -> "module:function" of its in-process entry point
+HOOKS: Dict[str, str] = {
+    "check-dependencies": "rapids_pre_commit_hooks.dependencies:main",
+    "check-file-modes": "rapids_pre_commit_hooks.file_modes:main",
+    "check-large-blobs": "rapids_pre_commit_hooks.large_blobs:main",
+    "check-versions": "rapids_pre_commit_hooks.versions:main",
+    "copyright-checker": "rapids_pre_commit_hooks.copyright:main",
+    "license-header-checker": "rapids_pre_commit_hooks.license_header:main",
+    "rapids-check": "rapids_pre_commit_hooks.pipeline:main",
+}
+
+
+def load_hook(hook: str) -> Callable[[Optional[Sequence[str]]], int]:
+    module, _, function = HOOKS[hook].partition(":")
+    return getattr(importlib.import_module(module), function)
+
+
+def pop_option(argv: List[str], option: str) -> Optional[str]:
+    """Remove ``option VALUE`` or ``option=VALUE`` from ``argv``.
+
+    Used for options that every hook accepts, which are handled here rather
+    than by each hook's own parser. Returns the last value given, if any.
+    """
+    value = None
+    i = 0
+    while i < len(argv) and argv[i] != "--":
+        if argv[i] == option and i + 1 < len(argv):
+            value = argv[i + 1]
+            del argv[i : i + 2]
+        elif argv[i].startswith(option + "="):
+            value = argv[i][len(option) + 1 :]
+            del argv[i]
+        else:
+            i += 1
+    return value
+
+
+def pop_flag(argv: List[str], option: str) -> bool:
+    """Remove every ``option`` from ``argv`` and return whether there was one."""
+    end = argv.index("--") if "--" in argv else len(argv)
+    found = option in argv[:end]
+    argv[:end] = [arg for arg in argv[:end] if arg != option]
+    return found
+
+
+def run_local(hook: str, argv: Sequence[str]) -> int:
+    """Run ``hook`` in this process, handling the options every hook accepts.
+
+    With ``--profile PATH``, the hook runs under cProfile; see
+    :mod:`rapids_pre_commit_hooks.profiling`. With ``--stats`` or
+    ``--stats-json PATH``, its metrics are printed to stderr or written to
+    ``PATH`` once it is done.
+    """
+    argv = list(argv)
+    profile = pop_option(argv, "--profile")
+    stats = pop_flag(argv, "--stats")
+    stats_json = pop_option(argv, "--stats-json")
+    if not (stats or stats_json):
+        return _run_profiled(hook, argv, profile)
+
+    from .metrics import METRICS
+
+    METRICS.reset(enabled=True)
+    try:
+        return _run_profiled(hook, argv, profile)
+    finally:
+        METRICS.enabled = False
+        if stats:
+            print(METRICS.format(), file=sys.stderr)
+        if stats_json:
+            import json
+
+            with open(stats_json, "w") as f:
+                json.dump(
+                    {"hook": hook, **METRICS.snapshot()}, f, indent=2, sort_keys=True
+                )
+                f.write("\n")
+
+
+def _run_profiled(hook: str, argv: List[str], profile: Optional[str]) -> int:
+    if profile is None:
+        return load_hook(hook)(argv)
+
+    from . import profiling
+
+    return profiling.run(lambda: load_hook(hook)(argv), profile)
+
+
+def run(hook: str, argv: Optional[Sequence[str]] = None) -> int:
+    """Run ``hook`` in the daemon if one is running, else in this process.
+
+    Profiled runs never go to the daemon, since its time would not show up in
+    the profile.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if pop_option(list(argv), "--profile") is None:
+        from . import daemon
+
+        returncode = daemon.forward(hook, argv)
+        if returncode is not None:
+            return returncode
+    return run_local(hook, argv)
+
+
+def check_dependencies() -> int:
+    return run("check-dependencies")
+
+
+def check_file_modes() -> int:
+    return run("check-file-modes")
+
+
+def check_large_blobs() -> int:
+    return run("check-large-blobs")
+
+
+def check_versions() -> int:
+    return run("check-versions")
+
+
+def copyright_checker() -> int:
+    return run("copyright-checker")
+
+
+def license_header_checker() -> int:
+    return run("license-header-checker")
+
+
+def rapids_check() -> int:
+    return run("rapids-check")
@@ -0,0 +1,189 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import datetime
+import hashlib
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from . import git, pipeline
+from .fix import Edit
+from .lines import Buffer, LineIndex
+from .matcher import NOTICE_RE, find_notices
+from .metrics import METRICS
+from .pipeline import Checker, LintWarning, Run, Source
+from .reader import DEFAULT_HEADER_WINDOW
+from .syntax import CommentSyntax, from_shebang
+
+CHECKER_VERSION = "copyright/4"
+
+# Lines that have to stay at the top of a file: a shebang, an XML declaration
+# or a Python encoding declaration.
+_PROLOGUE_RE = re.compile(rb"(?:#!|<\?xml|[ \t]*#.*coding[:=]).*(?:\n|$)")
+
+GIT = METRICS.timer("git")
+MATCH = METRICS.timer("match")
+
+
+def expected_years(
+    filenames: Sequence[str], unstaged: Set[str], staged: bool = False
+) -> Dict[str, int]:
+    """Year that the copyright notice of each file must extend to.
+
+    Files with uncommitted changes must be current; all others must cover the
+    last commit that touched them. If ``staged``, only changes in the index
+    count, since the staged content is what is checked. Files that were moved
+    without changes, and have no ``unstaged`` changes either, take the history
+    of their old path.
+    """
+    current_year = datetime.date.today().year
+    changed = git.changed_files(cached=staged)
+    renames = git.staged_renames()
+    origins = {
+        f: renames.get(f, f)
+        for f in filenames
+        if f not in changed or (f in renames and f not in unstaged)
+    }
+    history = git.last_change_years(set(origins.values()))
+    return {
+        f: history.get(origins[f], current_year) if f in origins else current_year
+        for f in filenames
+    }
+
+
+def insert_notice(content: Buffer, year: int, syntax: CommentSyntax) -> Edit:
+    """Edit that adds a notice after any lines that must stay first."""
+    pos = 0
+    while True:
+        match = _PROLOGUE_RE.match(content, pos)  # type: ignore[call-overload]
+        if not match:
+            break
+        pos = match.end()
+    text = syntax.comment(f"Copyright (c) {year}, NVIDIA CORPORATION.")
+    return Edit(pos, pos, f"{text}\n".encode())
+
+
+def check_content(
+    filename: str,
+    content: Buffer,
+    expected_year: int,
+    syntax: Optional[CommentSyntax] = None,
+    lines: Optional[LineIndex] = None,
+) -> Tuple[List[LintWarning], List[Edit]]:
+    """Check the NVIDIA notices in ``content`` against ``expected_year``.
+
+    Third-party notices, such as those in vendored code, count as a notice
+    being present but their years are left alone. The content is matched as
+    bytes, so it is never decoded, and fixes are returned as byte span edits.
+    Since a fix changes the file, it always extends notices to the current
+    year. A missing notice can only be added if the comment ``syntax`` of the
+    file is known. Line numbers are taken from ``lines`` if given.
+    """
+    current_year = datetime.date.today().year
+    warnings: List[LintWarning] = []
+    edits: List[Edit] = []
+    found = False
+
+    for notice in find_notices(content):
+        found = True
+        if notice.holder != "nvidia" or notice.last_year >= expected_year:
+            continue
+
+        if lines is None:
+            lines = LineIndex(content)
+        warnings.append(
+            LintWarning(filename, lines.line(notice.start), "copyright is out of date")
+        )
+        years = (
+            str(current_year)
+            if notice.first_year == current_year
+            else f"{notice.first_year}-{current_year}"
+        )
+        edits.append(Edit(notice.years_start, notice.years_end, years.encode()))
+
+    if not found:
+        warnings.append(LintWarning(filename, 1, "no copyright notice found"))
+        if syntax is not None:
+            edits.append(insert_notice(content, current_year, syntax))
+
+    return warnings, edits
+
+
+def check_blob(
+    filename: str,
+    blob: Buffer,
+    expected_year: int,
+    syntax: Optional[CommentSyntax] = None,
+    lines: Optional[LineIndex] = None,
+) -> Tuple[List[LintWarning], List[Edit]]:
+    with MATCH:
+        if syntax is None:
+            syntax = from_shebang(blob)
+        return check_content(filename, blob, expected_year, syntax, lines)
+
+
+def config_hash(expected_year: int, window: int) -> str:
+    return hashlib.sha1(
+        b"%s\0%d\0%d" % (NOTICE_RE.pattern, expected_year, window)
+    ).hexdigest()
+
+
+class CopyrightChecker(Checker):
+    name = "copyright"
+    version = CHECKER_VERSION
+    requires_syntax = True
+
+    def add_arguments(self, parser: argparse._ArgumentGroup) -> None:
+        parser.add_argument(
+            "--header-window",
+            type=int,
+            default=DEFAULT_HEADER_WINDOW // 1024,
+            metavar="KIB",
+            help="number of KiB at the start of each file to search for the "
+            "notice (default: %(default)s)",
+        )
+
+    def configure(self, args: argparse.Namespace) -> None:
+        self.window = args.header_window * 1024
+
+    def prepare(self, filenames: Sequence[str], run: Run) -> None:
+        with GIT:
+            self.years = expected_years(filenames, run.unstaged, run.staged)
+
+    def cache_config(self, filename: str) -> Optional[str]:
+        return config_hash(self.years[filename], self.window)
+
+    def check(self, source: Source) -> Tuple[List[LintWarning], List[Edit]]:
+        return check_blob(
+            source.filename,
+            source.content,
+            self.years[source.filename],
+            source.syntax,
+            source.lines,
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return pipeline.main(
+        argv,
+        ["copyright"],
+        prog="copyright-checker",
+        description="Verify that NVIDIA copyright notices are up to date.",
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
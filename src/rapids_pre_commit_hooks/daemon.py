@@ -0,0 +1,289 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# The client half of this module runs before any hook is imported, so only
+# cheap standard library modules may be imported at the top level.
+
+import contextlib
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from . import cli
+
+# Bump whenever the request or response format changes.
+PROTOCOL_VERSION = 1
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+_LENGTH = struct.Struct("!I")
+
+# Environment variables that hooks, and the git commands they run, depend on.
+# Nothing else, such as credentials, is sent to the daemon.
+FORWARDED_ENV = ("HOME", "LANG", "PATH", "TMPDIR", "TZ")
+FORWARDED_ENV_PREFIXES = ("GIT_", "LC_", "PRE_COMMIT")
+
+
+def _runtime_directory() -> str:
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, f"rapids-pre-commit-hooks-{os.getuid()}")
+
+
+def _check_private(path: str, mode: int) -> None:
+    """Refuse ``path`` unless this user owns it and nobody else can use it.
+
+    The runtime directory may be world-writable ``/tmp``, where any other
+    user could create the socket or its directory first.
+    """
+    st = os.lstat(path)
+    if (
+        stat.S_IFMT(st.st_mode) != mode
+        or st.st_uid != os.getuid()
+        or st.st_mode & 0o077
+    ):
+        raise PermissionError(f"{path} is not private to this user")
+
+
+def socket_path(root: Optional[str] = None) -> str:
+    """Per-user, per-repository socket path.
+
+    The socket lives in a directory that only this user can access. Its path
+    is derived from the repository root, which pre-commit uses as the working
+    directory of every hook, so clients need not run git to find it.
+    """
+    root = os.path.realpath(root or os.getcwd())
+    digest = hashlib.sha1(root.encode(errors="surrogateescape")).hexdigest()[:16]
+    return os.path.join(_runtime_directory(), f"{digest}.sock")
+
+
+def _forwarded(name: str) -> bool:
+    return name in FORWARDED_ENV or name.startswith(FORWARDED_ENV_PREFIXES)
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """The user at the other end of ``sock``, where the platform can tell."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    return struct.unpack("3i", creds)[1]
+
+
+def _send(sock: socket.socket, message: Dict[str, Any]) -> None:
+    data = json.dumps(message).encode()
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv(sock: socket.socket) -> Dict[str, Any]:
+    (size,) = _LENGTH.unpack(_recv_exactly(sock, _LENGTH.size))
+    return json.loads(_recv_exactly(sock, size))
+
+
+def forward(hook: str, argv: Sequence[str]) -> Optional[int]:
+    """Run ``hook`` in the daemon for this repository, if one is running.
+
+    Returns the hook's exit status, or ``None`` if no daemon answered, in
+    which case the caller should run the hook itself.
+    """
+    path = socket_path()
+    try:
+        _check_private(os.path.dirname(path), stat.S_IFDIR)
+        _check_private(path, stat.S_IFSOCK)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            if _peer_uid(sock) not in (None, os.getuid()):
+                return None
+            _send(
+                sock,
+                {
+                    "version": PROTOCOL_VERSION,
+                    "hook": hook,
+                    "argv": list(argv),
+                    "cwd": os.getcwd(),
+                    "env": {k: v for k, v in os.environ.items() if _forwarded(k)},
+                },
+            )
+            response = _recv(sock)
+    except OSError:
+        return None
+    if response.get("version") != PROTOCOL_VERSION:
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["returncode"]
+
+
+def _handle(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the requested hook in this process, which exits afterwards."""
+    import io
+    import traceback
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # Variables that the client did not forward keep the daemon's value, but
+    # those it would have forwarded are unset unless it did.
+    for name in list(os.environ):
+        if _forwarded(name):
+            del os.environ[name]
+    os.environ.update({k: v for k, v in request["env"].items() if _forwarded(k)})
+    os.chdir(request["cwd"])
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = cli.run_local(request["hook"], request["argv"])
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    return {
+        "version": PROTOCOL_VERSION,
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _serve_connection(conn: socket.socket) -> None:
+    with conn:
+        conn.settimeout(None)
+        if _peer_uid(conn) not in (None, os.getuid()):
+            return
+        try:
+            request = _recv(conn)
+            if request.get("version") == PROTOCOL_VERSION:
+                response = _handle(request)
+            else:
+                response = {"version": PROTOCOL_VERSION}
+            _send(conn, response)
+        except (OSError, ValueError):
+            pass
+
+
+def _reap(children: Set[int], block: bool = False) -> None:
+    for pid in list(children):
+        if os.waitpid(pid, 0 if block else os.WNOHANG)[0]:
+            children.discard(pid)
+
+
+def serve(path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Serve hook requests on ``path`` until idle for ``idle_timeout`` seconds.
+
+    Each request is handled in a child process forked from the daemon, so
+    that the parallel batches of pre-commit run concurrently. Children start
+    with every hook imported, and the working directory and environment that
+    a hook changes are their own.
+    """
+    # Import everything a hook needs up front, so requests find it warm.
+    for hook in cli.HOOKS:
+        cli.load_hook(hook)
+
+    directory = os.path.dirname(path)
+    with contextlib.suppress(FileExistsError):
+        os.mkdir(directory, 0o700)
+    _check_private(directory, stat.S_IFDIR)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            pass
+        else:
+            raise RuntimeError(f"a daemon is already listening on {path}")
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    old_umask = os.umask(0o177)
+    try:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+
+    children: Set[int] = set()
+    with server:
+        server.listen()
+        server.settimeout(idle_timeout)
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                _reap(children)
+                pid = os.fork()
+                if pid == 0:
+                    try:
+                        server.close()
+                        _serve_connection(conn)
+                    finally:
+                        # Never return into the accept loop, or run the
+                        # daemon's own cleanup.
+                        os._exit(0)
+                conn.close()
+                children.add(pid)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            _reap(children, block=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import signal
+    import subprocess
+
+    parser = argparse.ArgumentParser(
+        description="Keep rapids-pre-commit-hooks loaded for this repository, so "
+        "that hook runs skip interpreter startup and imports."
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        metavar="SECONDS",
+        help="exit after this long without requests (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    root = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        stdout=subprocess.PIPE,
+        check=True,
+        text=True,
+    ).stdout.strip()
+    os.chdir(root)
+    # Exit through serve()'s cleanup, which removes the socket.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        serve(socket_path(root), args.idle_timeout)
+    except (OSError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import fnmatch
+import itertools
+import json
+import os
+import posixpath
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from . import git
+from .cache import VerdictCache, open_cache
+from .metrics import METRICS
+
+DEFAULT_CONFIG = "dependencies.yaml"
+DEFAULT_CONDA_DIR = "conda/environments"
+
+# Bump whenever parsing changes, so that stale cached trees are never used.
+TREE_VERSION = "tree/1"
+
+CONDA = "conda"
+PYPROJECT = "pyproject"
+
+GIT = METRICS.timer("git")
+PARSE = METRICS.timer("parse")
+
+
+class ParseError(Exception):
+    """A file is not valid YAML or TOML."""
+
+
+def _parse(filename: str, data: bytes) -> Any:
+    if filename.endswith(".toml"):
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+        try:
+            return tomllib.loads(data.decode())
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+            raise ParseError(f"{filename}: could not parse: {e}") from e
+
+    import yaml
+
+    try:
+        return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        # Problems span several lines, with the position of each.
+        message = " ".join(str(e).split())
+        raise ParseError(f"{filename}: could not parse: {message}") from e
+
+
+def load_trees(
+    filenames: Iterable[str],
+    content_oids: Dict[str, str],
+    cache: Optional[VerdictCache] = None,
+) -> Dict[str, Any]:
+    """Parse YAML and TOML files, or ``None`` for those that do not exist.
+
+    Raises ``ParseError`` for the first file that cannot be parsed.
+
+    Trees of files listed in ``content_oids`` are cached by blob OID, so a
+    large source spec is only parsed again once it changes.
+    """
+    keys = {
+        f: (content_oids[f], TREE_VERSION, posixpath.splitext(f)[1])
+        for f in filenames
+        if f in content_oids
+    }
+    cached = cache.get_many(keys.values()) if cache else {}
+    METRICS.count("cache_hits", len(cached))
+    METRICS.count("cache_misses", len(keys) - len(cached))
+    trees: Dict[str, Any] = {}
+    parsed = []
+    for filename in filenames:
+        key = keys.get(filename)
+        if key in cached:
+            trees[filename] = json.loads(cached[key])
+            continue
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            trees[filename] = None
+            continue
+        with PARSE:
+            trees[filename] = _parse(filename, data)
+        if key:
+            parsed.append(filename)
+    if cache:
+        cache.put_many((keys[f], json.dumps(trees[f], default=str)) for f in parsed)
+    return trees
+
+
+class Output(NamedTuple):
+    """One section of a file generated from the source spec."""
+
+    path: str
+    output_type: str
+    # Keys of the section within the file
+    section: Sequence[str]
+    packages: List[Any]
+    channels: Optional[List[str]] = None
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _matrix_matches(
+    candidate: Optional[Dict[str, Any]], matrix: Dict[str, str]
+) -> bool:
+    # An empty matrix is the fallback that matches everything.
+    return all(
+        key in matrix and fnmatch.fnmatchcase(matrix[key], str(pattern))
+        for key, pattern in (candidate or {}).items()
+    )
+
+
+def packages(
+    config: Dict[str, Any],
+    includes: Sequence[str],
+    output_type: str,
+    matrix: Dict[str, str],
+) -> List[Any]:
+    """The packages that ``includes`` contribute to an output."""
+    result: List[Any] = []
+    for include in includes:
+        entry = config["dependencies"][include]
+        for common in entry.get("common") or []:
+            if output_type in _as_list(common.get("output_types")):
+                result.extend(common.get("packages") or [])
+        for specific in entry.get("specific") or []:
+            if output_type not in _as_list(specific.get("output_types")):
+                continue
+            for candidate in specific.get("matrices") or []:
+                if _matrix_matches(candidate.get("matrix"), matrix):
+                    result.extend(candidate.get("packages") or [])
+                    break
+    return result
+
+
+def _matrices(spec: Dict[str, Any]) -> List[Dict[str, str]]:
+    axes = {key: _as_list(values) for key, values in (spec or {}).items()}
+    return [
+        dict(zip(axes, (str(v) for v in values)))
+        for values in itertools.product(*axes.values())
+    ]
+
+
+def _pyproject_section(extras: Dict[str, Any]) -> List[str]:
+    table = extras.get("table", "project").split(".")
+    if "key" in extras:
+        return [*table, extras["key"]]
+    return [*table, "dependencies" if table == ["project"] else "requires"]
+
+
+def outputs(config: Dict[str, Any], config_dir: str = "") -> List[Output]:
+    """Every section generated from ``config``.
+
+    Files are named as rapids-dependency-file-generator names them. Only
+    conda environments and ``pyproject.toml`` tables are covered.
+    """
+    result = []
+    for key, spec in (config.get("files") or {}).items():
+        types = _as_list(spec.get("output"))
+        includes = spec.get("includes") or []
+        for matrix in _matrices(spec.get("matrix")):
+            if CONDA in types:
+                suffix = "".join(
+                    f"_{axis}-{value.replace('.', '')}"
+                    for axis, value in matrix.items()
+                )
+                directory = spec.get("conda_dir", DEFAULT_CONDA_DIR)
+                result.append(
+                    Output(
+                        posixpath.normpath(
+                            posixpath.join(config_dir, directory, f"{key}{suffix}.yaml")
+                        ),
+                        CONDA,
+                        ["dependencies"],
+                        packages(config, includes, CONDA, matrix),
+                        _as_list(config.get("channels")),
+                    )
+                )
+            if PYPROJECT in types:
+                directory = spec.get("pyproject_dir", ".")
+                result.append(
+                    Output(
+                        posixpath.normpath(
+                            posixpath.join(config_dir, directory, "pyproject.toml")
+                        ),
+                        PYPROJECT,
+                        _pyproject_section(spec.get("extras") or {}),
+                        packages(config, includes, PYPROJECT, matrix),
+                    )
+                )
+    return result
+
+
+def _normalize(items: Iterable[Any]) -> Set[str]:
+    result = set()
+    for item in items:
+        if isinstance(item, dict):
+            # Such as the pip section of a conda environment
+            for installer, names in item.items():
+                result.update(f"{installer}::{name}" for name in _as_list(names))
+        else:
+            result.add(str(item))
+    return result
+
+
+def _section(tree: Any, keys: Sequence[str]) -> Any:
+    for key in keys:
+        if not isinstance(tree, dict) or key not in tree:
+            return None
+        tree = tree[key]
+    return tree
+
+
+def compare(output: Output, tree: Any, config: str) -> List[str]:
+    """Describe how the generated section differs from what ``config`` says."""
+    if tree is None:
+        return [f"{output.path}: missing, but generated from {config}"]
+    errors = []
+    section = ".".join(output.section)
+    expected = _normalize(output.packages)
+    found = _normalize(_as_list(_section(tree, output.section)))
+    for package in sorted(expected - found):
+        errors.append(f"{output.path}: {section} lacks {package} from {config}")
+    for package in sorted(found - expected):
+        errors.append(f"{output.path}: {section} has {package}, not in {config}")
+    channels = _as_list(_section(tree, ["channels"]))
+    if output.channels is not None and channels != output.channels:
+        errors.append(f"{output.path}: channels differ from {config}")
+    return errors
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check-dependencies",
+        description="Verify that files generated from dependencies.yaml match it.",
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG,
+        help="the source spec (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not cache parsed files"
+    )
+    parser.add_argument("files", nargs="*", metavar="file")
+    args = parser.parse_args(argv)
+
+    config_path = posixpath.normpath(args.config.replace(os.sep, "/"))
+    filenames = {posixpath.normpath(f.replace(os.sep, "/")) for f in args.files}
+    METRICS.count("files", len(filenames))
+    cache = None if args.no_cache else open_cache()
+    with GIT:
+        entries = git.index_entries()
+        unstaged = git.unstaged_files()
+    content_oids = {f: e.oid for f, e in entries.items() if f not in unstaged}
+
+    try:
+        config = load_trees([config_path], content_oids, cache)[config_path]
+        if config is None:
+            return 0
+        expected = outputs(config, posixpath.dirname(config_path))
+        # Unless the spec itself changed, only the sections of the generated
+        # files that were passed in can have drifted.
+        if config_path not in filenames:
+            expected = [o for o in expected if o.path in filenames]
+        trees = load_trees(sorted({o.path for o in expected}), content_oids, cache)
+    except ParseError as e:
+        print(e)
+        return 1
+    finally:
+        if cache:
+            cache.close()
+
+    errors = [e for o in expected for e in compare(o, trees[o.path], config_path)]
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import fnmatch
+import os
+import posixpath
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from . import git, shard
+from .metrics import METRICS
+
+MODE_REGULAR = 0o100644
+MODE_EXECUTABLE = 0o100755
+
+# Symlink policies
+ALLOW = "allow"
+INTERNAL = "internal"
+FORBID = "forbid"
+
+GIT = METRICS.timer("git")
+
+
+def _matches(path: str, patterns: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def leaves_repository(path: str, target: str) -> bool:
+    """Whether a symlink at ``path`` to ``target`` points outside the work tree."""
+    if posixpath.isabs(target):
+        return True
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(path), target))
+    return resolved == ".." or resolved.startswith("../")
+
+
+def check_modes(
+    modes: Dict[str, int],
+    executable: Sequence[str] = (),
+    not_executable: Sequence[str] = (),
+    symlinks: str = INTERNAL,
+    targets: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Evaluate every policy against the index ``modes`` of some paths.
+
+    ``targets`` maps symlinks to their targets, and is only needed for the
+    ``internal`` symlink policy.
+    """
+    errors = []
+    for path, mode in sorted(modes.items()):
+        if mode == git.MODE_SYMLINK:
+            if symlinks == FORBID:
+                errors.append(f"{path}: symlinks are not allowed")
+            elif symlinks == INTERNAL and targets is not None:
+                target = targets.get(path)
+                if target is not None and leaves_repository(path, target):
+                    errors.append(
+                        f"{path}: symlink to {target} points outside the repository"
+                    )
+        elif mode == MODE_REGULAR and _matches(path, executable):
+            errors.append(f"{path}: must be executable ({MODE_EXECUTABLE:o})")
+        elif mode == MODE_EXECUTABLE and _matches(path, not_executable):
+            errors.append(f"{path}: must not be executable ({MODE_REGULAR:o})")
+    return errors
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check-file-modes",
+        description="Enforce executable-bit and symlink policies on staged files.",
+    )
+    parser.add_argument(
+        "--executable",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help=f"files matching GLOB must have mode {MODE_EXECUTABLE:o}",
+    )
+    parser.add_argument(
+        "--not-executable",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help=f"files matching GLOB must have mode {MODE_REGULAR:o}",
+    )
+    parser.add_argument(
+        "--symlinks",
+        choices=[ALLOW, INTERNAL, FORBID],
+        default=INTERNAL,
+        help="allow any symlink, only those within the repository, or none "
+        "(default: %(default)s)",
+    )
+    shard.add_argument(parser)
+    parser.add_argument("files", nargs="*", metavar="file")
+    args = parser.parse_args(argv)
+
+    filenames = sorted(set(args.files))
+    METRICS.count("files", len(filenames))
+    # Modes come from the index alone, and symlink targets from their blobs,
+    # so no file in the working tree is ever opened or stat()ed.
+    with GIT:
+        entries = git.index_entries()
+        if args.shard:
+            filenames = shard.select(filenames, args.shard, entries)
+        modes = {f: entries[f].mode for f in filenames if f in entries}
+        links = [f for f, mode in modes.items() if mode == git.MODE_SYMLINK]
+        targets = None
+        if args.symlinks == INTERNAL:
+            blobs = git.cat_file().read(entries[f].oid for f in links)
+            targets = {
+                f: os.fsdecode(bytes(blob))
+                for f, (_, blob) in zip(links, blobs)
+                if blob is not None
+            }
+
+    errors = check_modes(
+        modes, args.executable, args.not_executable, args.symlinks, targets
+    )
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
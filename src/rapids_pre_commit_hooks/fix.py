@@ -0,0 +1,104 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+from typing import BinaryIO, Dict, List, NamedTuple, Sequence
+
+from .metrics import METRICS
+from .parallel import starmap
+
+FIX = METRICS.timer("fix")
+
+# Only Linux can sendfile() to a regular file; elsewhere, such as on macOS,
+# the destination has to be a socket.
+_USE_SENDFILE = sys.platform.startswith("linux")
+
+
+class Edit(NamedTuple):
+    """Replace bytes ``start:end`` of a file with ``replacement``."""
+
+    start: int
+    end: int
+    replacement: bytes
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, count: int) -> None:
+    while count:
+        if _USE_SENDFILE:
+            # Let the kernel copy the unchanged bytes without a round trip
+            # through user space.
+            n = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+        else:
+            src.seek(offset)
+            n = dst.write(src.read(min(count, 1 << 20)))
+        if not n:
+            raise EOFError(f"{src.name} changed while it was being fixed")
+        offset += n
+        count -= n
+
+
+def apply_edits(filename: str, edits: Sequence[Edit]) -> bool:
+    """Apply ``edits`` to ``filename``, returning whether it changed.
+
+    Edits whose replacement matches the existing bytes are dropped, and files
+    left without edits are not touched at all. Otherwise the new content is
+    written to a temporary file next to the original, which then replaces it
+    atomically with the original's mode.
+    """
+    # Deferred, since it pulls in shutil and random and most runs fix nothing.
+    import tempfile
+
+    with FIX:
+        path = os.path.realpath(filename)
+        with open(path, "rb") as src:
+            pending = []
+            for edit in sorted(edits):
+                if pending and edit.start < pending[-1].end:
+                    raise ValueError(
+                        f"{filename}: overlapping edits {pending[-1]}, {edit}"
+                    )
+                src.seek(edit.start)
+                if src.read(edit.end - edit.start) != edit.replacement:
+                    pending.append(edit)
+            if not pending:
+                return False
+
+            st = os.fstat(src.fileno())
+            fd, tmp = tempfile.mkstemp(
+                dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}."
+            )
+            try:
+                # Unbuffered, so that writes and sendfile() share one file offset.
+                with os.fdopen(fd, "wb", buffering=0) as dst:
+                    pos = 0
+                    for edit in pending:
+                        _copy_range(src, dst, pos, edit.start - pos)
+                        dst.write(edit.replacement)
+                        pos = edit.end
+                    _copy_range(src, dst, pos, st.st_size - pos)
+                os.chmod(tmp, stat.S_IMODE(st.st_mode))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        return True
+
+
+def apply_all(edits: Dict[str, List[Edit]], jobs: int = 1) -> List[str]:
+    """Apply the edits for many files at once, returning the changed files."""
+    filenames = sorted(f for f, file_edits in edits.items() if file_edits)
+    changed = starmap(apply_edits, [(f, edits[f]) for f in filenames], jobs)
+    return [f for f, c in zip(filenames, changed) if c]
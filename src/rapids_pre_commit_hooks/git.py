@@ -0,0 +1,410 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import contextlib
+import functools
+import os
+import subprocess
+import threading
+from typing import IO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+_COMMIT_MARKER = b"\x01"
+MAX_PATHSPECS = 64
+
+
+def git(*args: str, input: Optional[bytes] = None) -> bytes:
+    return subprocess.run(
+        ["git", "--literal-pathspecs", *args],
+        input=input,
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+
+
+def has_commits(rev: str = "HEAD") -> bool:
+    return (
+        subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+            stdout=subprocess.DEVNULL,
+        ).returncode
+        == 0
+    )
+
+
+def git_dir() -> str:
+    return os.fsdecode(git("rev-parse", "--git-common-dir").rstrip(b"\n"))
+
+
+def _split_z(data: bytes) -> Iterator[str]:
+    for item in data.split(b"\0"):
+        if item:
+            yield os.fsdecode(item)
+
+
+def changed_files(rev: str = "HEAD", cached: bool = False) -> Set[str]:
+    """Paths whose index or working tree content differs from ``rev``.
+
+    Only the index is compared if ``cached`` is true.
+    """
+    if not has_commits(rev):
+        return set()
+    args = ["diff", "--name-only", "--no-renames", "-z"]
+    if cached:
+        args.append("--cached")
+    return set(_split_z(git(*args, rev)))
+
+
+class Change(NamedTuple):
+    status: str
+    old_path: Optional[str] = None
+    similarity: Optional[int] = None
+
+
+def merge_base(target: str, rev: str = "HEAD") -> str:
+    return git("merge-base", target, rev).decode().strip()
+
+
+def changes_since(base: str, cached: bool = False) -> Dict[str, Change]:
+    """Paths changed since ``base``, from one rename-detecting ``git diff``.
+
+    Changes are keyed by their new path; deleted paths are not included. The
+    working tree is compared unless ``cached`` is true, in which case the
+    index is.
+    """
+    args = ["diff", "--name-status", "-M", "-z"]
+    if cached:
+        args.append("--cached")
+    items = iter(_split_z(git(*args, base)))
+    changes = {}
+    for status in items:
+        if status[0] in "RC":
+            old_path = next(items)
+            changes[next(items)] = Change(status[0], old_path, int(status[1:]))
+        elif status[0] == "D":
+            next(items)
+        else:
+            changes[next(items)] = Change(status[0])
+    return changes
+
+
+def staged_renames(rev: str = "HEAD") -> Dict[str, str]:
+    """Map the new path of each file moved without changes to its old path."""
+    if not has_commits(rev):
+        return {}
+    return {
+        path: change.old_path
+        for path, change in changes_since(rev, cached=True).items()
+        if change.status == "R" and change.similarity == 100 and change.old_path
+    }
+
+
+def unstaged_files() -> Set[str]:
+    """Paths whose working tree content may differ from the index."""
+    return set(_split_z(git("diff-files", "--name-only", "-z")))
+
+
+class IndexEntry(NamedTuple):
+    mode: int
+    oid: str
+
+
+MODE_SYMLINK = 0o120000
+MODE_GITLINK = 0o160000
+
+
+def index_entries() -> Dict[str, IndexEntry]:
+    """Mode and blob OID of every path in the index, from one ``git ls-files``."""
+    entries = {}
+    for entry in _split_z(git("ls-files", "--stage", "-z")):
+        info, path = entry.split("\t", 1)
+        mode, oid, _ = info.split(" ")
+        entries[path] = IndexEntry(int(mode, 8), oid)
+    return entries
+
+
+def object_sizes(oids: Iterable[str]) -> Dict[str, int]:
+    """Size of each object, from one ``git cat-file --batch-check``.
+
+    Objects that are missing, such as the commits of submodules, are left out.
+    """
+    request = "".join(f"{oid}\n" for oid in set(oids)).encode()
+    if not request:
+        return {}
+    output = git("cat-file", "--batch-check=%(objectname) %(objectsize)", input=request)
+    sizes = {}
+    for line in output.decode().splitlines():
+        oid, size = line.split(" ")
+        # Anything but a size is a status, such as "missing".
+        if size.isdigit():
+            sizes[oid] = int(size)
+    return sizes
+
+
+def check_attr(paths: Iterable[str], *attrs: str) -> Dict[str, Dict[str, str]]:
+    """Values of ``attrs`` for each of ``paths``, from one ``git check-attr``.
+
+    Values are as reported by git: ``set``, ``unset``, ``unspecified`` or the
+    assigned value.
+    """
+    paths = b"".join(os.fsencode(p) + b"\0" for p in paths)
+    if not paths:
+        return {}
+    result: Dict[str, Dict[str, str]] = {}
+    # Values may be empty, so items must not be dropped like _split_z() does.
+    output = git("check-attr", "-z", "--stdin", *attrs, input=paths)
+    items = [os.fsdecode(item) for item in output.split(b"\0")[:-1]]
+    for path, attr, value in zip(items[::3], items[1::3], items[2::3]):
+        result.setdefault(path, {})[attr] = value
+    return result
+
+
+def _stream_z(stream, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    pending = b""
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        *items, pending = (pending + chunk).split(b"\0")
+        yield from items
+    if pending:
+        yield pending
+
+
+class LastChange(NamedTuple):
+    year: int
+    commit: str
+    # "A" if the commit added the path, which it may have been renamed to
+    status: str
+
+
+def last_changes(paths: Iterable[str], rev: str = "HEAD") -> Dict[str, LastChange]:
+    """The most recent commit touching each of ``paths``.
+
+    All paths are resolved by a single ``git log`` walk starting at ``rev``,
+    which is stopped as soon as every path has been seen. Paths with no
+    history are absent from the result.
+    """
+    remaining = set(paths)
+    changes: Dict[str, LastChange] = {}
+    if not remaining or not has_commits(rev):
+        return changes
+
+    # Revisions and pathspecs go through stdin so that the batch size is not
+    # limited by the maximum command line length. Matching every commit
+    # against many pathspecs costs far more than filtering the changed paths
+    # here, though, so large batches walk the history unrestricted.
+    spec = b""
+    if len(remaining) <= MAX_PATHSPECS:
+        spec = b"".join(os.fsencode(p) + b"\n" for p in sorted(remaining))
+    with subprocess.Popen(
+        [
+            "git",
+            "--literal-pathspecs",
+            "log",
+            "--stdin",
+            "--no-renames",
+            "--name-status",
+            "-z",
+            "--date=format:%Y",
+            f"--format={_COMMIT_MARKER.decode()}%H %cd",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    ) as proc:
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(rev.encode() + b"\n--\n" + spec)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        commit, year = "", 0
+        items = _stream_z(proc.stdout)
+        for item in items:
+            if item.startswith(_COMMIT_MARKER):
+                commit, _, date = item[len(_COMMIT_MARKER) :].decode().partition(" ")
+                year = int(date)
+                continue
+            status = item.strip().decode()
+            path = os.fsdecode(next(items))
+            if path in remaining:
+                remaining.discard(path)
+                changes[path] = LastChange(year, commit, status)
+                if not remaining:
+                    proc.kill()
+                    return changes
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    return changes
+
+
+def pure_renames(commits: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """Map the new path of each file that ``commits`` moved without changes
+    to its old path, by commit, from one ``git diff-tree``."""
+    spec = b"".join(c.encode() + b"\n" for c in commits)
+    if not spec:
+        return {}
+    output = git(
+        "diff-tree",
+        "--stdin",
+        "-r",
+        "-M",
+        "--diff-filter=R",
+        "--name-status",
+        "-z",
+        input=spec,
+    )
+    renames: Dict[str, Dict[str, str]] = {}
+    items = iter(output.split(b"\0")[:-1])
+    commit = ""
+    for item in items:
+        if not item.startswith(b"R"):
+            commit = item.decode()
+            continue
+        old_path, new_path = os.fsdecode(next(items)), os.fsdecode(next(items))
+        if item == b"R100":
+            renames.setdefault(commit, {})[new_path] = old_path
+    return renames
+
+
+def last_change_years(paths: Iterable[str], rev: str = "HEAD") -> Dict[str, int]:
+    """Year of the most recent commit touching each of ``paths``.
+
+    Commits that only moved a file, without changing it, do not count: the
+    history of its old path is followed instead, through any number of such
+    moves. Paths with no history are absent from the result.
+    """
+    changes = last_changes(paths, rev)
+    years = {path: change.year for path, change in changes.items()}
+    # Only commits that added one of the paths can have moved it there.
+    added = {c.commit for c in changes.values() if c.status == "A"}
+    for commit, renames in pure_renames(added).items():
+        moved = {
+            new: old
+            for new, old in renames.items()
+            if new in changes and changes[new].commit == commit
+        }
+        origins = last_change_years(set(moved.values()), f"{commit}^")
+        for new, old in moved.items():
+            if old in origins:
+                years[new] = origins[old]
+    return years
+
+
+class CatFile:
+    """A long-lived ``git cat-file --batch`` process.
+
+    Object contents are returned as :class:`memoryview` objects over freshly
+    read buffers, so they can be sliced without further copies.
+    """
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _start(self) -> subprocess.Popen:
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._proc
+
+    def close(self) -> None:
+        if self._proc is not None:
+            assert self._proc.stdin is not None and self._proc.stdout is not None
+            with contextlib.suppress(BrokenPipeError):
+                self._proc.stdin.close()
+            self._proc.stdout.close()
+            self._proc.wait()
+            self._proc = None
+
+    @staticmethod
+    def _write_requests(stdin: IO[bytes], objects: List[str]) -> None:
+        try:
+            stdin.write(b"".join(obj.encode() + b"\n" for obj in objects))
+            stdin.flush()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    @staticmethod
+    def _read_exactly(stdout: IO[bytes], buf: memoryview) -> None:
+        pos = 0
+        while pos < len(buf):
+            n = stdout.readinto(buf[pos:])  # type: ignore[attr-defined]
+            if not n:
+                raise EOFError("git cat-file exited unexpectedly")
+            pos += n
+
+    @staticmethod
+    def _discard(stdout: IO[bytes], size: int) -> None:
+        while size:
+            chunk = stdout.read(min(size, 1 << 16))
+            if not chunk:
+                raise EOFError("git cat-file exited unexpectedly")
+            size -= len(chunk)
+
+    def read(
+        self, objects: Iterable[str], limit: Optional[int] = None
+    ) -> Iterator[Tuple[str, Optional[memoryview]]]:
+        """Yield ``(object, content)`` for each of ``objects``, in order.
+
+        All requests are written to git up front by a helper thread, so git
+        never waits for us to ask for the next object. If ``limit`` is given,
+        only that many leading bytes of each object are kept and the rest is
+        discarded as it streams past. Missing objects yield ``None``.
+        """
+        objects = list(objects)
+        proc = self._start()
+        assert proc.stdin is not None and proc.stdout is not None
+        writer = threading.Thread(
+            target=self._write_requests, args=(proc.stdin, objects), daemon=True
+        )
+        writer.start()
+
+        done = 0
+        try:
+            for obj in objects:
+                header = proc.stdout.readline()
+                if not header:
+                    raise EOFError("git cat-file exited unexpectedly")
+                fields = header.split()
+                if len(fields) != 3:
+                    # "<object> missing" or "<object> ambiguous"
+                    done += 1
+                    yield obj, None
+                    continue
+
+                size = int(fields[2])
+                keep = size if limit is None else min(size, limit)
+                buf = memoryview(bytearray(keep))
+                self._read_exactly(proc.stdout, buf)
+                # Skip the rest of the object and the trailing newline.
+                self._discard(proc.stdout, size - keep + 1)
+                done += 1
+                yield obj, buf
+        finally:
+            if done < len(objects):
+                # The response stream is out of sync, so start over next time.
+                proc.kill()
+                writer.join()
+                self.close()
+            else:
+                writer.join()
+
+
+@functools.lru_cache(maxsize=None)
+def cat_file() -> CatFile:
+    """The :class:`CatFile` shared by everything in this process."""
+    reader = CatFile()
+    atexit.register(reader.close)
+    return reader
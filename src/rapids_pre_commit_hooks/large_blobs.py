@@ -0,0 +1,113 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import fnmatch
+import sys
+from typing import List, NamedTuple, Optional, Sequence
+
+from . import git, shard
+from .metrics import METRICS
+
+DEFAULT_MAX_SIZE = 500 * 1024
+
+GIT = METRICS.timer("git")
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size in bytes, optionally with a ``K``, ``M`` or ``G`` suffix."""
+    unit = value[-1:].upper() if value[-1:].isalpha() else ""
+    try:
+        return int(value[: len(value) - len(unit)]) * _UNITS[unit]
+    except (KeyError, ValueError):
+        raise argparse.ArgumentTypeError(f"invalid size: {value}")
+
+
+class Allowance(NamedTuple):
+    pattern: str
+    # None allows blobs of any size.
+    max_size: Optional[int]
+
+    @classmethod
+    def parse(cls, value: str) -> "Allowance":
+        pattern, sep, size = value.rpartition("=")
+        if not sep:
+            return cls(value, None)
+        return cls(pattern, parse_size(size))
+
+
+def size_limit(
+    path: str, allowances: Sequence[Allowance], default: int
+) -> Optional[int]:
+    """The largest blob allowed at ``path``, from the first matching allowance."""
+    for allowance in allowances:
+        if fnmatch.fnmatchcase(path, allowance.pattern):
+            return allowance.max_size
+    return default
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check-large-blobs",
+        description="Reject staged blobs that are larger than allowed.",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=parse_size,
+        default=DEFAULT_MAX_SIZE,
+        metavar="SIZE",
+        help="largest blob allowed, in bytes or with a K, M or G suffix "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--allow",
+        type=Allowance.parse,
+        action="append",
+        default=[],
+        metavar="GLOB[=SIZE]",
+        help="allow blobs at paths matching GLOB up to SIZE, or of any size; "
+        "the first matching GLOB applies",
+    )
+    shard.add_argument(parser)
+    parser.add_argument("files", nargs="*", metavar="file")
+    args = parser.parse_args(argv)
+
+    filenames = sorted(set(args.files))
+    METRICS.count("files", len(filenames))
+    # Sizes come from the index and the object database alone, so no file in
+    # the working tree is ever opened or stat()ed.
+    with GIT:
+        entries = git.index_entries()
+        if args.shard:
+            filenames = shard.select(filenames, args.shard, entries)
+        staged = {f: entries[f].oid for f in filenames if f in entries}
+        sizes = git.object_sizes(staged.values())
+
+    errors: List[str] = []
+    for filename, oid in staged.items():
+        size = sizes.get(oid)
+        limit = size_limit(filename, args.allow, args.max_size)
+        if size is not None and limit is not None and size > limit:
+            errors.append(
+                f"{filename}: blob is {size} bytes, more than the {limit} allowed"
+            )
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
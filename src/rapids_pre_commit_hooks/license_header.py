@@ -0,0 +1,163 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import posixpath
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import pipeline
+from .fix import Edit
+from .lines import Buffer, LineIndex
+from .metrics import METRICS
+from .pipeline import Checker, LintWarning, Source
+from .syntax import SYNTAXES
+
+CHECKER_VERSION = "license/1"
+
+LICENSE_LINES = (
+    'Licensed under the Apache License, Version 2.0 (the "License");',
+    "you may not use this file except in compliance with the License.",
+    "You may obtain a copy of the License at",
+    "",
+    "    http://www.apache.org/licenses/LICENSE-2.0",
+    "",
+    "Unless required by applicable law or agreed to in writing, software",
+    'distributed under the License is distributed on an "AS IS" BASIS,',
+    "WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.",
+    "See the License for the specific language governing permissions and",
+    "limitations under the License.",
+)
+
+# The license itself, and similar files, do not carry the header. They are
+# matched by their whole stem, and only with a plain text suffix, so that
+# source files such as license.py are still checked.
+EXCLUDED_NAMES = ("COPYING", "LICENSE", "NOTICE")
+EXCLUDED_SUFFIXES = ("", ".md", ".rst", ".txt")
+
+MATCH = METRICS.timer("match")
+
+_ANCHOR = LICENSE_LINES[0].encode()
+
+
+def _leaders() -> List[str]:
+    leaders = set()
+    for syntax in SYNTAXES.values():
+        if syntax.line is not None:
+            leaders.add(syntax.line)
+        if syntax.block:
+            # Lines inside block comments, plain or C-style continuations
+            leaders.update(["", " *"])
+    return sorted(leaders)
+
+
+def render(leader: str) -> bytes:
+    """The header as written with each line commented by ``leader``."""
+    return b"".join(
+        (f"{leader} {line}" if line and leader else line or leader).encode() + b"\n"
+        for line in LICENSE_LINES
+    )
+
+
+def fingerprint(block: Buffer) -> bytes:
+    return hashlib.sha1(block).digest()
+
+
+# Comment leader, without trailing whitespace -> (length, fingerprint) of the
+# header written with that leader
+FINGERPRINTS: Dict[bytes, Tuple[int, bytes]] = {
+    leader.encode(): (len(render(leader)), fingerprint(render(leader)))
+    for leader in _leaders()
+}
+
+
+_CONFIG = hashlib.sha1("\n".join(LICENSE_LINES).encode()).hexdigest()
+
+
+def _normalize(line: bytes, leader: bytes) -> str:
+    if line.startswith(leader):
+        line = line[len(leader) :]
+    return line.strip().decode(errors="replace")
+
+
+def check_content(
+    filename: str, content: Buffer, lines: Optional[LineIndex] = None
+) -> Tuple[List[LintWarning], List[Edit]]:
+    """Check that ``content`` carries the Apache-2.0 header unmodified.
+
+    The comment leader of the header is taken from its first line, and the
+    block that follows is accepted with a single fingerprint compare. Only a
+    block that does not match is compared line by line, ignoring whitespace
+    and the leader, to find where it differs.
+    """
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    index = content.find(_ANCHOR)
+    if index < 0:
+        return [LintWarning(filename, 1, "no Apache-2.0 license header found")], []
+    start = content.rfind(b"\n", 0, index) + 1
+    leader = bytes(content[start:index]).rstrip()
+    expected = FINGERPRINTS.get(leader)
+    if expected is not None:
+        length, digest = expected
+        if fingerprint(content[start : start + length]) == digest:
+            return [], []
+
+    if lines is None:
+        lines = LineIndex(content)
+    first = lines.line(start)
+    for n, expected_line in enumerate(LICENSE_LINES):
+        line = content[lines.start(first + n) : lines.end(first + n)]
+        found = _normalize(line, leader)
+        if found != expected_line.strip():
+            message = (
+                "license header differs from the Apache-2.0 text: "
+                f"expected {expected_line.strip()!r}, found {found!r}"
+            )
+            return [LintWarning(filename, first + n, message)], []
+    # Only whitespace, or a comment leader without a fingerprint, differs.
+    return [], []
+
+
+class LicenseChecker(Checker):
+    name = "license"
+    version = CHECKER_VERSION
+    requires_syntax = True
+
+    def selects(self, filename: str) -> bool:
+        stem, suffix = posixpath.splitext(posixpath.basename(filename))
+        return not (
+            stem.upper() in EXCLUDED_NAMES and suffix.lower() in EXCLUDED_SUFFIXES
+        )
+
+    def cache_config(self, filename: str) -> Optional[str]:
+        # The verdict only depends on the content and the canonical text.
+        return _CONFIG
+
+    def check(self, source: Source) -> Tuple[List[LintWarning], List[Edit]]:
+        with MATCH:
+            return check_content(source.filename, source.content, source.lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return pipeline.main(
+        argv,
+        ["license"],
+        prog="license-header-checker",
+        description="Verify that files carry the Apache-2.0 license header.",
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import functools
+import mmap
+import re
+from array import array
+from typing import Any, List, Optional, Sequence, Union
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_NEWLINE_RE = re.compile(b"\n")
+
+# The first scan of a buffer covers at least this many bytes, and every
+# later one at least doubles the part scanned so far.
+MIN_SCAN = 4096
+# Below this many bytes, a scan is not worth importing NumPy for.
+NUMPY_MIN_SCAN = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Optional[Any]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class LineIndex:
+    """Conversion between byte offsets and 1-based line numbers of a buffer.
+
+    The offsets of newlines are kept in an ``array('Q')``, and are only found
+    as far into the buffer as queries have reached, so a checker that only
+    looks at the header of a file never pays for indexing the rest of it.
+    Lookups are binary searches. Large scans, and :meth:`lines`, use NumPy if
+    it is installed.
+    """
+
+    def __init__(self, buffer: Buffer):
+        self._buffer = buffer
+        self._size = len(buffer)
+        self._newlines = array("Q")
+        # Number of bytes at the start of the buffer searched for newlines
+        self._scanned = 0
+
+    def _scan(self, end: int) -> None:
+        end = min(self._size, max(end, 2 * self._scanned, MIN_SCAN))
+        np = _numpy() if end - self._scanned >= NUMPY_MIN_SCAN else None
+        if np is not None:
+            chunk = np.frombuffer(
+                self._buffer,
+                dtype=np.uint8,
+                count=end - self._scanned,
+                offset=self._scanned,
+            )
+            found = np.flatnonzero(chunk == ord("\n")) + self._scanned
+            self._newlines.frombytes(found.astype(np.uint64).tobytes())
+        else:
+            self._newlines.extend(
+                m.start()
+                for m in _NEWLINE_RE.finditer(self._buffer, self._scanned, end)
+            )
+        self._scanned = end
+
+    def _scan_offset(self, offset: int) -> None:
+        if offset > self._scanned and self._scanned < self._size:
+            self._scan(offset)
+
+    def _scan_line(self, line: int) -> None:
+        # Line n starts after the (n - 1)th newline.
+        while len(self._newlines) < line - 1 and self._scanned < self._size:
+            self._scan(self._scanned + 1)
+
+    def line(self, offset: int) -> int:
+        """Line number of the byte at ``offset``."""
+        self._scan_offset(offset)
+        return bisect.bisect_left(self._newlines, offset) + 1
+
+    def lines(self, offsets: Sequence[int]) -> List[int]:
+        """Line numbers of the bytes at each of ``offsets``."""
+        if not offsets:
+            return []
+        self._scan_offset(max(offsets))
+        np = _numpy() if len(offsets) > 1 else None
+        if np is None:
+            return [bisect.bisect_left(self._newlines, o) + 1 for o in offsets]
+        newlines = np.frombuffer(self._newlines, dtype=np.uint64)
+        return (np.searchsorted(newlines, offsets) + 1).tolist()
+
+    def start(self, line: int) -> int:
+        """Byte offset of the first byte of ``line``.
+
+        The offset just past the end of the buffer is returned for lines
+        after the last one.
+        """
+        if line <= 1:
+            return 0
+        self._scan_line(line)
+        if len(self._newlines) < line - 1:
+            return self._size
+        return self._newlines[line - 2] + 1
+
+    def end(self, line: int) -> int:
+        """Byte offset just past the end of ``line``, including its newline."""
+        return self.start(line + 1)
@@ -0,0 +1,104 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Dict, Iterator, NamedTuple, Pattern, Sequence
+
+from .lines import Buffer
+from .syntax import comment_leaders
+
+# A notice may also appear without any leader, as in plain text files.
+COMMENT_LEADERS = tuple(comment_leaders())
+
+# Holders are tried in order, so the catch-all third-party pattern, which
+# recognises notices in vendored code, must come last.
+HOLDERS: Dict[str, bytes] = {
+    "nvidia": rb"NVIDIA[ \t]+C(?:ORPORATION|orporation)",
+    "third_party": rb"\S[^\n]*",
+}
+
+
+class Notice(NamedTuple):
+    holder: str
+    first_year: int
+    last_year: int
+    # Byte offsets into the searched content
+    start: int
+    years_start: int
+    years_end: int
+
+
+def compile_notice_pattern(
+    holders: Dict[str, bytes] = HOLDERS,
+    leaders: Sequence[str] = COMMENT_LEADERS,
+) -> Pattern[bytes]:
+    """Combine all comment leaders and holders into a single bytes regex.
+
+    Everything the pattern has to tell apart is ASCII, so it runs on the raw
+    content of files, which never has to be decoded.
+    """
+    leader = b"|".join(re.escape(leader.encode()) for leader in leaders)
+    holder = b"|".join(
+        b"(?P<holder_%s>%s)" % (name.encode(), pattern)
+        for name, pattern in holders.items()
+    )
+    return re.compile(
+        rb"^[ \t]*(?:(?:%s)[ \t]*)?"
+        rb"Copyright[ \t]+(?:\([cC]\)[ \t]+)?"
+        rb"(?P<years>(?P<first_year>[0-9]{4})(?:-(?P<last_year>[0-9]{4}))?)"
+        rb",?[ \t]+(?:%s)" % (leader, holder),
+        re.MULTILINE,
+    )
+
+
+NOTICE_RE = compile_notice_pattern()
+# Every notice contains this literal
+_ANCHOR = b"Copyright"
+
+
+def find_notices(
+    content: Buffer, pattern: Pattern[bytes] = NOTICE_RE
+) -> Iterator[Notice]:
+    """Find all copyright notices in ``content``.
+
+    ``pattern`` must come from :func:`compile_notice_pattern`. Rather than
+    trying it at the start of every line, the content is scanned for the
+    literal ``Copyright``, which runs at memchr speed, and the pattern is
+    only tried at the start of the lines where that is found.
+    """
+    if isinstance(content, memoryview):
+        # Header windows are small, and bytes have find() and rfind().
+        content = content.tobytes()
+    pos = 0
+    while True:
+        index = content.find(_ANCHOR, pos)
+        if index < 0:
+            break
+        match = pattern.match(content, content.rfind(b"\n", 0, index) + 1)
+        if match is None:
+            pos = index + len(_ANCHOR)
+            continue
+        pos = match.end()
+        # The holder group is the last one to close in every alternative.
+        holder = match.lastgroup
+        assert holder is not None and holder.startswith("holder_")
+        first_year = int(match.group("first_year"))
+        yield Notice(
+            holder=holder[len("holder_") :],
+            first_year=first_year,
+            last_year=int(match.group("last_year") or first_year),
+            start=match.start(),
+            years_start=match.start("years"),
+            years_end=match.end("years"),
+        )
@@ -0,0 +1,111 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Any, Dict, Optional
+
+Snapshot = Dict[str, Dict[str, Any]]
+
+
+class Timer:
+    """Context manager that adds the time spent in it to a :class:`Registry`.
+
+    Timers are meant to be created once, at import time, and entered as
+    often as needed. While the registry is disabled, entering and leaving a
+    timer only checks :attr:`Registry.enabled`.
+    """
+
+    __slots__ = ("_registry", "name", "_start")
+
+    def __init__(self, registry: "Registry", name: str):
+        self._registry = registry
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if self._registry.enabled:
+            self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._registry.enabled:
+            self._registry.add_time(self.name, time.perf_counter() - self._start)
+
+
+class Registry:
+    """Named timers and counters, collected only while :attr:`enabled`."""
+
+    def __init__(self) -> None:
+        self._timers: Dict[str, Timer] = {}
+        self.reset()
+
+    def reset(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+
+    def timer(self, name: str) -> Timer:
+        if name not in self._timers:
+            self._timers[name] = Timer(self, name)
+        return self._timers[name]
+
+    def add_time(self, name: str, seconds: float, calls: int = 1) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self) -> Snapshot:
+        return {
+            "timers": {
+                name: {"seconds": self.seconds[name], "calls": self.calls[name]}
+                for name in sorted(self.seconds)
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def merge(self, snapshot: Snapshot) -> None:
+        """Add the metrics of ``snapshot``, e.g. from a worker process."""
+        for name, timer in snapshot["timers"].items():
+            self.add_time(name, timer["seconds"], timer["calls"])
+        for name, n in snapshot["counters"].items():
+            self.count(name, n)
+
+    def cache_hit_rate(self) -> Optional[float]:
+        hits = self.counters.get("cache_hits", 0)
+        lookups = hits + self.counters.get("cache_misses", 0)
+        return hits / lookups if lookups else None
+
+    def format(self) -> str:
+        lines = [f"{'timer':24} {'calls':>8} {'total (s)':>10} {'mean (ms)':>10}"]
+        for name, timer in self.snapshot()["timers"].items():
+            seconds, calls = timer["seconds"], timer["calls"]
+            lines.append(
+                f"{name:24} {calls:8} {seconds:10.3f} {seconds / calls * 1e3:10.3f}"
+            )
+        lines.append(f"{'counter':24} {'value':>8}")
+        for name, n in self.snapshot()["counters"].items():
+            lines.append(f"{name:24} {n:8}")
+        hit_rate = self.cache_hit_rate()
+        if hit_rate is not None:
+            lines.append(f"{'cache hit rate':24} {hit_rate:8.1%}")
+        return "\n".join(lines)
+
+
+# Timers in worker processes are summed into this registry by
+# :func:`rapids_pre_commit_hooks.parallel.starmap`, so totals are CPU time
+# across processes rather than wall time.
+METRICS = Registry()
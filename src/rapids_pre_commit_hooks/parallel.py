@@ -0,0 +1,76 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from .metrics import METRICS, Snapshot
+
+T = TypeVar("T")
+
+# Below this many items, starting worker processes costs more than it saves.
+MIN_PARALLEL_ITEMS = 64
+MAX_CHUNK_SIZE = 256
+
+
+def default_jobs() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _measured(fn: Callable[..., T], *args: Any) -> Tuple[T, Snapshot]:
+    METRICS.reset(enabled=True)
+    return fn(*args), METRICS.snapshot()
+
+
+def starmap(
+    fn: Callable[..., T],
+    args: Sequence[Tuple[Any, ...]],
+    jobs: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> List[T]:
+    """Return ``[fn(*a) for a in args]``, computed by up to ``jobs`` processes.
+
+    Items are sent to the workers in chunks, and results come back in the
+    order of ``args`` regardless of which worker finished first. Metrics
+    collected by the workers are merged into :data:`METRICS`. If given,
+    ``initializer(*initargs)`` is called once in every process that runs
+    ``fn``, which is cheaper than passing the same state with every item.
+    """
+    if jobs <= 1 or len(args) < MIN_PARALLEL_ITEMS:
+        if initializer is not None:
+            initializer(*initargs)
+        return [fn(*a) for a in args]
+
+    # Deferred, since it pulls in multiprocessing and most runs are small.
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = min(jobs, len(args))
+    chunksize = max(1, min(MAX_CHUNK_SIZE, len(args) // (jobs * 4)))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        if not METRICS.enabled:
+            return list(executor.map(fn, *zip(*args), chunksize=chunksize))
+        results = []
+        for result, snapshot in executor.map(
+            _measured, itertools.repeat(fn), *zip(*args), chunksize=chunksize
+        ):
+            METRICS.merge(snapshot)
+            results.append(result)
+        return results
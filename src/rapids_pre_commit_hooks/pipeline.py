@@ -0,0 +1,395 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from . import git, shard
+from .cache import DEFAULT_MAX_ENTRIES, CacheKey, open_cache
+from .fix import Edit, apply_all
+from .lines import Buffer, LineIndex
+from .metrics import METRICS
+from .parallel import default_jobs, starmap
+from .prefilter import text_files
+from .reader import DEFAULT_HEADER_WINDOW, read_header
+from .syntax import REGISTRY, SYNTAXES, CommentSyntax, SyntaxRegistry, from_shebang
+
+GIT = METRICS.timer("git")
+READ = METRICS.timer("read")
+
+# Checker name -> "module:class", imported only when the checker is used
+CHECKERS: Dict[str, str] = {
+    "copyright": "rapids_pre_commit_hooks.copyright:CopyrightChecker",
+    "license": "rapids_pre_commit_hooks.license_header:LicenseChecker",
+}
+
+
+class LintWarning(NamedTuple):
+    filename: str
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.filename}:{self.line}: {self.message}"
+
+
+CheckResult = Tuple[List[LintWarning], List[Edit]]
+
+
+class Source:
+    """The content of one file, shared by every checker that runs on it.
+
+    ``content`` may only be the start of the file; see :attr:`Checker.window`.
+    """
+
+    __slots__ = ("filename", "content", "syntax", "lines")
+
+    def __init__(
+        self,
+        filename: str,
+        content: Buffer,
+        syntax: Optional[CommentSyntax],
+        lines: Optional[LineIndex] = None,
+    ):
+        self.filename = filename
+        self.content = content
+        self.syntax = syntax
+        self.lines = LineIndex(content) if lines is None else lines
+
+    def head(self, window: Optional[int]) -> "Source":
+        """This source cut down to its first ``window`` bytes."""
+        if window is None or window >= len(self.content):
+            return self
+        return Source(
+            self.filename, memoryview(self.content)[:window], self.syntax, self.lines
+        )
+
+
+class Run(NamedTuple):
+    """What checkers may need to know about the run as a whole."""
+
+    args: argparse.Namespace
+    entries: Dict[str, git.IndexEntry]
+    # Files with unstaged changes
+    unstaged: Set[str]
+    # Files whose checked content is known to be their index blob
+    content_oids: Dict[str, str]
+    # Whether the staged content is checked rather than the working tree
+    staged: bool = False
+
+
+class Checker:
+    """A check that :func:`main` runs on the content of each selected file.
+
+    Checkers are registered with :func:`register`, and are run either on
+    their own as a hook or together with every other checker by
+    ``rapids-check``. Either way, each file is read once and its content is
+    handed to every checker that selects it.
+    """
+
+    #: Name used by ``--checks``, and in output of ``--stats``
+    name = ""
+    #: Bump whenever a change can change a verdict for a given file, so that
+    #: stale cache entries are never used
+    version = ""
+    #: Number of bytes at the start of each file the checker needs to see,
+    #: or ``None`` for all of them
+    window: Optional[int] = DEFAULT_HEADER_WINDOW
+    #: Whether only files with a known comment syntax, by path or ``#!``
+    #: line, are checked; others, such as Markdown, are passed without one
+    requires_syntax = False
+
+    def add_arguments(self, parser: argparse._ArgumentGroup) -> None:
+        """Add the options of this checker."""
+
+    def configure(self, args: argparse.Namespace) -> None:
+        """Take the options of this checker from the parsed ``args``."""
+
+    def selects(self, filename: str) -> bool:
+        return True
+
+    def prepare(self, filenames: Sequence[str], run: Run) -> None:
+        """Gather what ``filenames`` are checked against, e.g. from git."""
+
+    def cache_config(self, filename: str) -> Optional[str]:
+        """Everything but the content that the verdict for ``filename``
+        depends on, or ``None`` if the verdict must not be cached."""
+        return None
+
+    def check(self, source: Source) -> CheckResult:
+        raise NotImplementedError
+
+
+def register(name: str, target: str) -> None:
+    """Make the :class:`Checker` subclass at ``target`` available as ``name``.
+
+    ``target`` is given as ``"module:class"``, and the module is only
+    imported when the checker is used.
+    """
+    if CHECKERS.get(name, target) != target:
+        raise ValueError(f"a different checker is registered as {name}")
+    CHECKERS[name] = target
+
+
+def load_checker(name: str) -> Checker:
+    module, _, cls = CHECKERS[name].partition(":")
+    return getattr(importlib.import_module(module), cls)()
+
+
+def encode_verdict(warnings: List[LintWarning]) -> str:
+    return json.dumps([[w.line, w.message] for w in warnings])
+
+
+def decode_verdict(filename: str, verdict: str) -> List[LintWarning]:
+    return [
+        LintWarning(filename, line, message) for line, message in json.loads(verdict)
+    ]
+
+
+def _window(checkers: Sequence[Checker]) -> Optional[int]:
+    windows = [c.window for c in checkers]
+    return None if None in windows else max(windows)  # type: ignore[type-var]
+
+
+# The checkers of the current run, by name, in this process and every worker
+_ACTIVE: Dict[str, Checker] = {}
+
+
+def _activate(checkers: Sequence[Checker]) -> None:
+    _ACTIVE.clear()
+    _ACTIVE.update((c.name, c) for c in checkers)
+
+
+def check_source(
+    filename: str,
+    content: Optional[bytes],
+    syntax: Optional[CommentSyntax],
+    names: Sequence[str],
+) -> Dict[str, CheckResult]:
+    """Run the named active checkers on ``filename``.
+
+    The file is read once, as far as the checker with the largest window
+    needs, unless its ``content`` is given already.
+    """
+    checkers = [_ACTIVE[name] for name in names]
+    if content is None:
+        with READ:
+            content = read_header(filename, _window(checkers))
+    if syntax is None:
+        syntax = from_shebang(content)
+    source = Source(filename, content, syntax)
+    results: Dict[str, CheckResult] = {}
+    for checker in checkers:
+        if syntax is None and checker.requires_syntax:
+            results[checker.name] = ([], [])
+        else:
+            results[checker.name] = checker.check(source.head(checker.window))
+    if syntax is None and any(c.requires_syntax for c in checkers):
+        METRICS.count("skipped_no_syntax")
+    return results
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    checks: Optional[Sequence[str]] = None,
+    prog: str = "rapids-check",
+    description: str = "Run every RAPIDS check on each file in a single pass.",
+) -> int:
+    """Run the ``checks`` (default: all registered checkers) on files."""
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument("--fix", action="store_true", help="fix what can be fixed")
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="check the staged content of files instead of the working tree",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not use the verdict cache"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="maximum number of cached verdicts (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="number of processes to check files with (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--target-branch",
+        metavar="BRANCH",
+        help="only check files changed since the merge base with BRANCH, and "
+        "treat all other files as up to date",
+    )
+    parser.add_argument(
+        "--comment-syntax",
+        action="append",
+        default=[],
+        metavar="[DIR:]KEY=SYNTAX",
+        help="use SYNTAX (one of: %s) for files named, or with the suffix, KEY, "
+        "in DIR and below" % ", ".join(SYNTAXES),
+    )
+    shard.add_argument(parser)
+    if checks is None:
+        checks = list(CHECKERS)
+        parser.add_argument(
+            "--checks",
+            type=lambda value: value.split(","),
+            default=checks,
+            metavar="NAME,...",
+            help=f"checks to run (default: {','.join(checks)})",
+        )
+    checkers = [load_checker(name) for name in checks]
+    for checker in checkers:
+        checker.add_arguments(parser.add_argument_group(checker.name))
+    parser.add_argument("files", nargs="*", metavar="file")
+    args = parser.parse_args(argv)
+
+    if args.staged and args.fix:
+        parser.error("--fix cannot be used with --staged")
+    if "checks" in args:
+        unknown = set(args.checks) - set(checks)
+        if unknown:
+            parser.error(f"unknown checks: {', '.join(sorted(unknown))}")
+        checkers = [c for c in checkers if c.name in args.checks]
+    # Overrides go into a registry of their own, so that they do not leak into
+    # later runs in the same process, such as in the daemon.
+    registry = SyntaxRegistry() if args.comment_syntax else REGISTRY
+    for override in args.comment_syntax:
+        scope, _, syntax = override.rpartition("=")
+        directory, _, key = scope.rpartition(":")
+        if not key or syntax not in SYNTAXES:
+            parser.error(f"invalid --comment-syntax: {override}")
+        registry.add_override(directory, key, SYNTAXES[syntax])
+    for checker in checkers:
+        checker.configure(args)
+
+    # Each file is checked, and possibly fixed, exactly once even if it was
+    # passed more than once, so no two workers ever write the same file.
+    filenames = sorted(set(args.files))
+    METRICS.count("files", len(filenames))
+    cache = None if args.no_cache else open_cache(max_entries=args.cache_size)
+    with GIT:
+        entries = git.index_entries()
+        if args.shard:
+            in_shard = shard.select(filenames, args.shard, entries)
+            METRICS.count("skipped_shard", len(filenames) - len(in_shard))
+            filenames = in_shard
+        unstaged = set() if args.staged else git.unstaged_files()
+        if args.target_branch:
+            try:
+                base = git.merge_base(args.target_branch)
+            except subprocess.CalledProcessError:
+                parser.error(
+                    f"--target-branch: no merge base with {args.target_branch}"
+                )
+            changes = git.changes_since(base, cached=args.staged)
+            changed = [f for f in filenames if f in changes or f not in entries]
+            METRICS.count("skipped_unchanged", len(filenames) - len(changed))
+            filenames = changed
+    content_oids = {
+        f: entries[f].oid for f in filenames if f in entries and f not in unstaged
+    }
+
+    filenames = text_files(filenames, entries, content_oids, cache)
+    run = Run(args, entries, unstaged, content_oids, args.staged)
+    selected = {c.name: [f for f in filenames if c.selects(f)] for c in checkers}
+    for checker in checkers:
+        checker.prepare(selected[checker.name], run)
+
+    keys: Dict[Tuple[str, str], CacheKey] = {}
+    for checker in checkers:
+        for filename in selected[checker.name]:
+            config = checker.cache_config(filename)
+            if config is not None and checker.requires_syntax:
+                # Whether the file is checked at all depends on its syntax,
+                # which its content only determines through a #! line.
+                syntax = registry.lookup(filename)
+                config = f"{config}\0{syntax.name if syntax else ''}"
+            if filename in content_oids and config is not None:
+                keys[filename, checker.name] = (
+                    content_oids[filename],
+                    checker.version,
+                    config,
+                )
+    cached = cache.get_many(keys.values()) if cache else {}
+    METRICS.count("cache_hits", len(cached))
+    METRICS.count("cache_misses", len(keys) - len(cached))
+
+    results: Dict[Tuple[str, str], List[LintWarning]] = {}
+    todo: Dict[str, List[str]] = {}
+    for checker in checkers:
+        for filename in selected[checker.name]:
+            key = keys.get((filename, checker.name))
+            verdict = cached.get(key) if key else None
+            # A cached verdict with warnings still has to be opened to be fixed.
+            if verdict is not None and not (args.fix and verdict != "[]"):
+                results[filename, checker.name] = decode_verdict(filename, verdict)
+            else:
+                todo.setdefault(filename, []).append(checker.name)
+    pending = sorted(todo)
+    METRICS.count("files_checked", len(pending))
+
+    contents: Dict[str, bytes] = {}
+    if args.staged:
+        staged = [f for f in pending if f in content_oids]
+        with READ:
+            blobs = git.cat_file().read(
+                (content_oids[f] for f in staged), limit=_window(checkers)
+            )
+            contents = {
+                filename: bytes(blob)
+                for filename, (_, blob) in zip(staged, blobs)
+                if blob is not None
+            }
+
+    jobs = [
+        (filename, contents.get(filename), registry.lookup(filename), todo[filename])
+        for filename in pending
+    ]
+    edits: Dict[str, List[Edit]] = {}
+    for (filename, *_), file_results in zip(
+        jobs, starmap(check_source, jobs, args.jobs, _activate, (checkers,))
+    ):
+        for name, (file_warnings, file_edits) in file_results.items():
+            results[filename, name] = file_warnings
+            edits.setdefault(filename, []).extend(file_edits)
+    if args.fix:
+        apply_all(edits, args.jobs)
+
+    if cache:
+        cache.put_many(
+            (keys[f, name], encode_verdict(results[f, name]))
+            for f in pending
+            for name in todo[f]
+            if (f, name) in keys
+        )
+        cache.close()
+
+    warnings = sorted(w for file_warnings in results.values() for w in file_warnings)
+    for warning in warnings:
+        print(warning)
+    return 1 if warnings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
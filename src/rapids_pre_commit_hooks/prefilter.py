@@ -0,0 +1,143 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import posixpath
+from typing import Dict, List, Optional, Sequence
+
+from . import git
+from .cache import VerdictCache
+from .metrics import METRICS
+from .reader import read_header
+
+TEXT = "text"
+BINARY = "binary"
+GENERATED = "generated"
+SPECIAL = "special"
+
+CLASSIFIER_VERSION = "prefilter/1"
+SNIFF_SIZE = 8 * 1024
+
+BINARY_SUFFIXES = frozenset(
+    [
+        ".a",
+        ".bin",
+        ".bz2",
+        ".dll",
+        ".dylib",
+        ".exe",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jar",
+        ".jpeg",
+        ".jpg",
+        ".o",
+        ".pdf",
+        ".png",
+        ".pyc",
+        ".rlib",
+        ".so",
+        ".tar",
+        ".whl",
+        ".xz",
+        ".zip",
+        ".zst",
+    ]
+)
+GENERATED_SUFFIXES = (".min.css", ".min.js")
+
+PREFILTER = METRICS.timer("prefilter")
+
+
+def _from_metadata(
+    filename: str, entry: Optional[git.IndexEntry], attrs: Dict[str, str]
+) -> Optional[str]:
+    if entry is not None and entry.mode in (git.MODE_SYMLINK, git.MODE_GITLINK):
+        return SPECIAL
+    if attrs.get("binary") == "set" or attrs.get("text") == "unset":
+        return BINARY
+    if attrs.get("linguist-generated") not in (None, "unspecified", "unset", "false"):
+        return GENERATED
+    if posixpath.splitext(filename)[1].lower() in BINARY_SUFFIXES:
+        return BINARY
+    if filename.endswith(GENERATED_SUFFIXES):
+        return GENERATED
+    return None
+
+
+def _sniff(content: bytes) -> str:
+    return BINARY if b"\0" in content[:SNIFF_SIZE] else TEXT
+
+
+def classify(
+    filenames: Sequence[str],
+    entries: Dict[str, git.IndexEntry],
+    content_oids: Dict[str, str],
+    cache: Optional[VerdictCache] = None,
+) -> Dict[str, str]:
+    """Classify files as text, binary, generated or special (links).
+
+    Index modes, ``.gitattributes`` and file names are consulted first. Only
+    the remaining files are sniffed for NUL bytes in their first
+    :data:`SNIFF_SIZE` bytes. Files listed in ``content_oids`` are known to
+    match that blob, which is then read instead, and whose class is cached.
+    """
+    attrs = git.check_attr(filenames, "binary", "text", "linguist-generated")
+    classes: Dict[str, str] = {}
+    unknown = []
+    for filename in filenames:
+        cls = _from_metadata(filename, entries.get(filename), attrs.get(filename, {}))
+        if cls is None:
+            unknown.append(filename)
+        else:
+            classes[filename] = cls
+
+    keys = {
+        f: (content_oids[f], CLASSIFIER_VERSION, str(SNIFF_SIZE))
+        for f in unknown
+        if f in content_oids
+    }
+    cached = cache.get_many(keys.values()) if cache else {}
+    to_read = []
+    for filename in unknown:
+        key = keys.get(filename)
+        if key in cached:
+            classes[filename] = cached[key]
+        elif key:
+            to_read.append(filename)
+        else:
+            classes[filename] = _sniff(read_header(filename, SNIFF_SIZE))
+
+    blobs = git.cat_file().read((content_oids[f] for f in to_read), limit=SNIFF_SIZE)
+    for filename, (_, blob) in zip(to_read, blobs):
+        classes[filename] = TEXT if blob is None else _sniff(bytes(blob))
+    if cache:
+        cache.put_many((keys[f], classes[f]) for f in to_read)
+
+    return classes
+
+
+def text_files(
+    filenames: Sequence[str],
+    entries: Dict[str, git.IndexEntry],
+    content_oids: Dict[str, str],
+    cache: Optional[VerdictCache] = None,
+) -> List[str]:
+    with PREFILTER:
+        classes = classify(filenames, entries, content_oids, cache)
+    if METRICS.enabled:
+        for cls in classes.values():
+            if cls != TEXT:
+                METRICS.count(f"skipped_{cls}")
+    return [f for f in filenames if classes[f] == TEXT]
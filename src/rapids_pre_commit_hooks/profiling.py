@@ -0,0 +1,94 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Only imported when --profile is given, so that unprofiled runs pay nothing.
+
+import collections
+import cProfile
+import pstats
+from typing import Callable, Counter, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Func = Tuple[str, int, str]
+
+COLLAPSED_SUFFIX = ".folded"
+# Stacks below this many microseconds are dropped from the collapsed output.
+MIN_STACK_USEC = 1
+
+
+def _label(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{name} ({filename}:{line})".replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Counter[str]:
+    """Approximate collapsed stacks, in microseconds, from ``stats``.
+
+    cProfile only records caller/callee pairs, so the time of a function that
+    is called from several places is split between them in proportion to the
+    time each caller spent in it. Recursive calls are folded into the
+    outermost frame.
+    """
+    raw: Dict[Func, tuple] = stats.stats  # type: ignore[attr-defined]
+    children: Dict[Func, Dict[Func, tuple]] = collections.defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children[caller][func] = edge
+
+    stacks: Counter[str] = collections.Counter()
+
+    def visit(func: Func, path: Tuple[Func, ...], fraction: float) -> None:
+        _, _, tt, ct, _ = raw[func]
+        usec = int(tt * fraction * 1e6)
+        if usec >= MIN_STACK_USEC:
+            stacks[";".join(_label(f) for f in path)] += usec
+        if ct <= 0:
+            return
+        for child, (_, _, _, edge_ct) in children[func].items():
+            child_ct = raw[child][3]
+            if child in path or child_ct <= 0:
+                continue
+            child_fraction = edge_ct * fraction / child_ct
+            if child_ct * child_fraction * 1e6 >= MIN_STACK_USEC:
+                visit(child, path + (child,), child_fraction)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            visit(func, (func,), 1.0)
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, path: str) -> None:
+    """Write ``stats`` in the collapsed-stack format of ``flamegraph.pl``."""
+    with open(path, "w") as f:
+        for stack, usec in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {usec}\n")
+
+
+def run(fn: Callable[[], T], path: str) -> T:
+    """Call ``fn`` under cProfile.
+
+    The statistics are written to ``path`` in pstats format, and as collapsed
+    stacks to ``path`` with :data:`COLLAPSED_SUFFIX` appended, even if ``fn``
+    raises or exits.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(path)
+        write_collapsed(pstats.Stats(profiler), path + COLLAPSED_SUFFIX)
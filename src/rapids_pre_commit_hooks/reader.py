@@ -0,0 +1,28 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+DEFAULT_HEADER_WINDOW = 16 * 1024
+
+
+def read_header(filename: str, window: Optional[int] = DEFAULT_HEADER_WINDOW) -> bytes:
+    """Read at most the first ``window`` bytes of ``filename``, or all of
+    it if ``window`` is ``None``.
+
+    Checkers that only look at file headers use this so that memory and I/O
+    per file are bounded regardless of the file's size.
+    """
+    with open(filename, "rb") as f:
+        return f.read(window)
@@ -0,0 +1,93 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import hashlib
+import heapq
+from typing import Dict, List, NamedTuple, Sequence
+
+from . import git
+
+# Every file costs about as much as reading this many bytes, however small it
+# is, so that shards of many small files are not overloaded.
+FILE_COST = 4096
+
+
+class Shard(NamedTuple):
+    # 1-based, as in --shard 1/4 ... --shard 4/4
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        index, sep, count = value.partition("/")
+        try:
+            shard = cls(int(index), int(count))
+        except ValueError:
+            shard = None
+        if not sep or shard is None or not 1 <= shard.index <= shard.count:
+            raise argparse.ArgumentTypeError(f"invalid shard: {value}")
+        return shard
+
+
+def add_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--shard",
+        type=Shard.parse,
+        metavar="INDEX/COUNT",
+        help="only check the files of shard INDEX (1 to COUNT) of COUNT shards "
+        "of about the same total size",
+    )
+
+
+def _hash(path: str) -> int:
+    return int.from_bytes(hashlib.sha1(path.encode()).digest()[:8], "big")
+
+
+def assign(weights: Dict[str, int], count: int) -> Dict[str, int]:
+    """Assign paths to ``count`` shards (0-based) of similar total weight.
+
+    Paths go to the lightest shard in order of decreasing weight, ties broken
+    by a stable hash of the path, so the result only depends on ``weights``.
+    """
+    shards = [(0, i) for i in range(count)]
+    assignment = {}
+    for path in sorted(weights, key=lambda p: (-weights[p], _hash(p), p)):
+        total, index = heapq.heappop(shards)
+        assignment[path] = index
+        heapq.heappush(shards, (total + weights[path], index))
+    return assignment
+
+
+def select(
+    filenames: Sequence[str], shard: Shard, entries: Dict[str, git.IndexEntry]
+) -> List[str]:
+    """The ``filenames`` that belong to ``shard``.
+
+    Shards are balanced over every file in the index, weighted by blob size,
+    rather than over ``filenames``. That way every runner agrees on which
+    shard a file belongs to, even when the files are passed in batches that
+    differ between runners, as pre-commit does depending on the number of
+    CPUs. Files outside the index are assigned by a stable hash of the path.
+    """
+    sizes = git.object_sizes(entry.oid for entry in entries.values())
+    assignment = assign(
+        {path: sizes.get(e.oid, 0) + FILE_COST for path, e in entries.items()},
+        shard.count,
+    )
+    return [
+        f
+        for f in filenames
+        if assignment.get(f, _hash(f) % shard.count) == shard.index - 1
+    ]
@@ -0,0 +1,188 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import posixpath
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class CommentSyntax(NamedTuple):
+    name: str
+    line: Optional[str] = None
+    block: Optional[Tuple[str, str]] = None
+
+    def comment(self, text: str) -> str:
+        if self.line is not None:
+            return f"{self.line} {text}" if self.line else text
+        assert self.block is not None
+        return f"{self.block[0]} {text} {self.block[1]}"
+
+
+HASH = CommentSyntax("hash", line="#")
+C = CommentSyntax("c", line="//", block=("/*", "*/"))
+CSS = CommentSyntax("css", block=("/*", "*/"))
+DASH = CommentSyntax("dash", line="--")
+XML = CommentSyntax("xml", block=("<!--", "-->"))
+TEXT = CommentSyntax("text", line="")
+
+SYNTAXES: Dict[str, CommentSyntax] = {
+    s.name: s for s in (HASH, C, CSS, DASH, XML, TEXT)
+}
+
+BY_SUFFIX: Dict[str, CommentSyntax] = {
+    **dict.fromkeys(
+        [
+            ".bash",
+            ".cfg",
+            ".cmake",
+            ".ini",
+            ".pxd",
+            ".pxi",
+            ".py",
+            ".pyi",
+            ".pyx",
+            ".r",
+            ".sh",
+            ".toml",
+            ".yaml",
+            ".yml",
+        ],
+        HASH,
+    ),
+    **dict.fromkeys(
+        [
+            ".c",
+            ".cc",
+            ".cpp",
+            ".cu",
+            ".cuh",
+            ".cxx",
+            ".go",
+            ".h",
+            ".hh",
+            ".hpp",
+            ".java",
+            ".js",
+            ".proto",
+            ".rs",
+            ".scala",
+            ".ts",
+        ],
+        C,
+    ),
+    ".css": CSS,
+    **dict.fromkeys([".hs", ".lua", ".sql"], DASH),
+    **dict.fromkeys([".html", ".xml"], XML),
+}
+
+BY_FILENAME: Dict[str, CommentSyntax] = {
+    **dict.fromkeys(
+        [
+            ".clang-format",
+            ".dockerignore",
+            ".flake8",
+            ".gitattributes",
+            ".gitignore",
+            "CMakeLists.txt",
+            "Dockerfile",
+            "Makefile",
+        ],
+        HASH,
+    ),
+    **dict.fromkeys(["LICENSE", "NOTICE"], TEXT),
+}
+
+BY_INTERPRETER: Dict[str, CommentSyntax] = {
+    **dict.fromkeys(["bash", "perl", "python", "ruby", "sh", "zsh"], HASH),
+    "node": C,
+    "lua": DASH,
+}
+
+_SHEBANG_RE = re.compile(rb"#![ \t]*(?P<path>\S+)(?:[ \t]+(?P<arg>[^ \t\r\n-]\S*))?")
+
+
+def from_shebang(header: bytes) -> Optional[CommentSyntax]:
+    """Comment syntax for the interpreter named in a ``#!`` line, if any."""
+    match = _SHEBANG_RE.match(header)
+    if not match:
+        return None
+    interpreter = os.path.basename(match.group("path"))
+    if interpreter == b"env" and match.group("arg"):
+        interpreter = match.group("arg")
+    # python3.11 -> python
+    name = interpreter.decode(errors="replace").rstrip("0123456789.")
+    return BY_INTERPRETER.get(name)
+
+
+def comment_leaders() -> List[str]:
+    """Every string that can start a comment line in a known syntax."""
+    leaders = set()
+    for syntax in SYNTAXES.values():
+        if syntax.line:
+            leaders.add(syntax.line)
+        if syntax.block:
+            leaders.add(syntax.block[0])
+            # Continuation lines of C-style block comments
+            leaders.add("*")
+    return sorted(leaders)
+
+
+def _normdir(directory: str) -> str:
+    directory = posixpath.normpath(directory.replace(os.sep, "/"))
+    return "" if directory == "." else directory
+
+
+class SyntaxRegistry:
+    """Maps paths to comment syntaxes with one dict lookup per path.
+
+    Overrides apply to a directory and everything below it. The table that
+    results from merging the defaults with all overrides of a directory and
+    its ancestors is built once per directory and then reused.
+    """
+
+    def __init__(self):
+        self._overrides: Dict[str, Dict[str, CommentSyntax]] = {}
+        self._tables: Dict[str, Dict[str, CommentSyntax]] = {}
+
+    def add_override(self, directory: str, key: str, syntax: CommentSyntax) -> None:
+        """Use ``syntax`` for files named, or with the suffix, ``key``."""
+        self._overrides.setdefault(_normdir(directory), {})[key] = syntax
+        self._tables.clear()
+
+    def _table(self, directory: str) -> Dict[str, CommentSyntax]:
+        try:
+            return self._tables[directory]
+        except KeyError:
+            pass
+        if directory:
+            parent = self._table(posixpath.dirname(directory))
+        else:
+            parent = {**BY_SUFFIX, **BY_FILENAME}
+        # Directories without overrides share their parent's table.
+        overrides = self._overrides.get(directory)
+        table = {**parent, **overrides} if overrides else parent
+        self._tables[directory] = table
+        return table
+
+    def lookup(self, path: str) -> Optional[CommentSyntax]:
+        directory, name = posixpath.split(path.replace(os.sep, "/"))
+        table = self._table(_normdir(directory))
+        syntax = table.get(name)
+        if syntax is None:
+            syntax = table.get(posixpath.splitext(name)[1].lower())
+        return syntax
+
+
+REGISTRY = SyntaxRegistry()
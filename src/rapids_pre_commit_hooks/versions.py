@@ -0,0 +1,280 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import collections
+import fnmatch
+import os
+import posixpath
+import re
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from . import git
+from .metrics import METRICS
+
+# Only literal versions are collected; anything else, such as a Jinja
+# expression or a CMake variable, is skipped.
+_VERSION = r"(?P<version>[0-9]+(?:\.[0-9A-Za-z]+)*)"
+
+# Any line starting with "[" is a table header, including "[[array.of.tables]]".
+# Indented ones are not matched, as they may belong to a multi-line array.
+_TOML_TABLE_RE = re.compile(r"\[(?P<array>\[)?(?P<table>[^\[\]]*)")
+_TOML_KEY_RE = re.compile(
+    r"\s*(?P<key>name|version)\s*=\s*[\"'](?P<value>[^\"']*)[\"']"
+)
+_JINJA_SET_RE = re.compile(
+    r"\s*\{%-?\s*set\s+(?P<key>name|version)\s*=\s*[\"'](?P<value>[^\"']*)[\"']"
+)
+_YAML_SECTION_RE = re.compile(r"(?P<section>[A-Za-z_]+):\s*(?:#.*)?$")
+_YAML_KEY_RE = re.compile(r"\s+(?P<key>name|version):\s*[\"']?(?P<value>[^\"'\s#]*)")
+_CMAKE_PROJECT_RE = re.compile(
+    r"\bproject\s*\(\s*(?P<name>[A-Za-z0-9_.+-]+)[^)]*?\bVERSION\s+" + _VERSION,
+    re.IGNORECASE,
+)
+_LITERAL_RE = re.compile(_VERSION + r"$")
+
+GIT = METRICS.timer("git")
+SCAN = METRICS.timer("read")
+
+
+class VersionLiteral(NamedTuple):
+    filename: str
+    line: int
+    # None for files that do not name their package, such as VERSION
+    name: Optional[str]
+    version: str
+
+
+Scanner = Callable[[str, Iterable[str]], Iterator[VersionLiteral]]
+
+
+def scan_pyproject(filename: str, lines: Iterable[str]) -> Iterator[VersionLiteral]:
+    """The version of the ``[project]`` table, stopping right after it."""
+    table = None
+    name = None
+    version: Optional[Tuple[int, str]] = None
+    for n, line in enumerate(lines, 1):
+        match = _TOML_TABLE_RE.match(line)
+        if match:
+            if table == "project":
+                break
+            table = None if match.group("array") else match.group("table").strip()
+        elif table == "project":
+            match = _TOML_KEY_RE.match(line)
+            if match and match.group("key") == "name":
+                name = match.group("value")
+            elif match:
+                version = (n, match.group("value"))
+    if version is not None and _LITERAL_RE.match(version[1]):
+        yield VersionLiteral(filename, version[0], name, version[1])
+
+
+def scan_conda_recipe(filename: str, lines: Iterable[str]) -> Iterator[VersionLiteral]:
+    """The version of a ``meta.yaml``, from a Jinja ``set`` or the
+    ``package`` section, stopping right after that section."""
+    section = None
+    values: Dict[str, Tuple[int, str]] = {}
+    for n, line in enumerate(lines, 1):
+        match = _JINJA_SET_RE.match(line)
+        if match:
+            values.setdefault(match.group("key"), (n, match.group("value")))
+            continue
+        match = _YAML_SECTION_RE.match(line)
+        if match:
+            if section == "package":
+                break
+            section = match.group("section")
+        elif section == "package":
+            match = _YAML_KEY_RE.match(line)
+            if match and _LITERAL_RE.match(match.group("value")):
+                values[match.group("key")] = (n, match.group("value"))
+            elif match and match.group("key") == "name":
+                values.setdefault("name", (n, match.group("value")))
+    if "version" in values and _LITERAL_RE.match(values["version"][1]):
+        line, version = values["version"]
+        yield VersionLiteral(filename, line, values.get("name", (0, None))[1], version)
+
+
+def scan_version_file(filename: str, lines: Iterable[str]) -> Iterator[VersionLiteral]:
+    """The first non-empty line of a ``VERSION`` file."""
+    for n, line in enumerate(lines, 1):
+        if line.strip():
+            if _LITERAL_RE.match(line.strip()):
+                yield VersionLiteral(filename, n, None, line.strip())
+            return
+
+
+def scan_cmake(filename: str, lines: Iterable[str]) -> Iterator[VersionLiteral]:
+    """The ``VERSION`` of the first ``project()`` call, stopping after it."""
+    pending = ""
+    start = 0
+    for n, line in enumerate(lines, 1):
+        code = line.split("#", 1)[0]
+        if not pending:
+            if not re.search(r"\bproject\s*\(", code, re.IGNORECASE):
+                continue
+            start = n
+        pending += code
+        if ")" in code:
+            match = _CMAKE_PROJECT_RE.search(pending)
+            if match:
+                yield VersionLiteral(
+                    filename, start, match.group("name"), match.group("version")
+                )
+            return
+
+
+SCANNERS: Dict[str, Scanner] = {
+    "pyproject.toml": scan_pyproject,
+    "meta.yaml": scan_conda_recipe,
+    "VERSION": scan_version_file,
+    "CMakeLists.txt": scan_cmake,
+}
+
+
+def _manifest(filename: str) -> bool:
+    return posixpath.basename(filename) in SCANNERS
+
+
+def scan(filenames: Iterable[str]) -> List[VersionLiteral]:
+    """Collect version literals from every file with a scanner in a single pass.
+
+    Each file is read line by line, and only until its scanner has found
+    what it looks for.
+    """
+    literals = []
+    for filename in filenames:
+        scanner = SCANNERS.get(posixpath.basename(filename))
+        if scanner is None:
+            continue
+        with SCAN, open(filename, encoding="utf-8", errors="replace") as f:
+            literals.extend(scanner(filename, f))
+    return literals
+
+
+def normalize(version: str) -> Tuple[str, ...]:
+    """``24.02.00``, ``24.2`` and ``24.02`` all normalize to ``("24", "2")``."""
+    parts = [(p.lstrip("0") or "0") if p.isdigit() else p for p in version.split(".")]
+    while len(parts) > 1 and parts[-1] == "0":
+        parts.pop()
+    return tuple(parts)
+
+
+def _package(name: Optional[str]) -> Optional[str]:
+    return None if name is None else re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _scope(filename: str, roots: Dict[str, VersionLiteral]) -> Optional[str]:
+    """The directory of the nearest ``VERSION`` file above ``filename``."""
+    directory = posixpath.dirname(filename)
+    while True:
+        if directory in roots:
+            return directory
+        if not directory:
+            return None
+        directory = posixpath.dirname(directory)
+
+
+def mismatches(literals: Sequence[VersionLiteral], by_package: bool) -> List[str]:
+    """Describe every literal that disagrees with the others of its group.
+
+    Each ``VERSION`` file is the reference for the manifests in its own
+    directory and below, up to any nested ``VERSION`` file, so vendored code
+    with its own ``VERSION`` file is compared against that. Other manifests
+    are compared against their most common version. Within that, literals
+    are grouped by package if ``by_package``, and otherwise all belong to one
+    group, as in a repository that versions everything together.
+    """
+    roots = {
+        posixpath.dirname(lit.filename): lit for lit in literals if lit.name is None
+    }
+    groups: Dict[Tuple[Optional[str], Optional[str]], List[VersionLiteral]]
+    groups = collections.defaultdict(list)
+    for lit in literals:
+        if lit.name is not None:
+            package = _package(lit.name) if by_package else None
+            groups[_scope(lit.filename, roots), package].append(lit)
+
+    errors = []
+    for (scope, _), members in groups.items():
+        members.sort()
+        if scope is not None:
+            reference = roots[scope]
+        else:
+            counts = collections.Counter(normalize(lit.version) for lit in members)
+            reference = max(members, key=lambda lit: counts[normalize(lit.version)])
+        for lit in members:
+            if normalize(lit.version) != normalize(reference.version):
+                errors.append(
+                    f"{lit.filename}:{lit.line}: version {lit.version} does not "
+                    f"match {reference.version} in {reference.filename}"
+                )
+    return sorted(errors)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check-versions",
+        description="Verify that version literals agree across manifests.",
+    )
+    parser.add_argument(
+        "--by-package",
+        action="store_true",
+        help="only compare versions of the same package, rather than all of them",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="ignore manifests at paths matching GLOB, such as vendored code",
+    )
+    parser.add_argument("files", nargs="*", metavar="file")
+    args = parser.parse_args(argv)
+
+    def selected(filename: str) -> bool:
+        return _manifest(filename) and not any(
+            fnmatch.fnmatchcase(filename, pattern) for pattern in args.exclude
+        )
+
+    filenames = {posixpath.normpath(f.replace(os.sep, "/")) for f in args.files}
+    METRICS.count("files", len(filenames))
+    if not any(selected(f) for f in filenames):
+        return 0
+    # A changed manifest can disagree with any other one, so every tracked
+    # manifest is scanned, not only those that were passed in.
+    with GIT:
+        entries = git.index_entries()
+    manifests = sorted({f for f in [*entries, *filenames] if selected(f)})
+    errors = mismatches(
+        scan(m for m in manifests if os.path.exists(m)), args.by_package
+    )
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import os
+import subprocess
+import sys
+
+import pytest
+
+import rapids_pre_commit_hooks
+
+CURRENT_YEAR = datetime.date.today().year
+
+SRC = os.path.dirname(os.path.dirname(rapids_pre_commit_hooks.__file__))
+
+
+def hook_env():
+    """The environment for running hooks in a new interpreter, with no daemon
+    and no global git configuration."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC, env.get("PYTHONPATH")]))
+    env["XDG_RUNTIME_DIR"] = ""
+    env["GIT_CONFIG_GLOBAL"] = os.devnull
+    env["GIT_CONFIG_NOSYSTEM"] = "1"
+    return env
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """An empty repository, which is also the working directory."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    monkeypatch.chdir(path)
+    for name, value in hook_env().items():
+        if name.startswith("GIT_") or name == "XDG_RUNTIME_DIR":
+            monkeypatch.setenv(name, value)
+    subprocess.run(["git", "init", "-q", "-b", "main"], check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
+    return path
+
+
+@pytest.fixture
+def run_git(repo):
+    """Run git in ``repo`` and return its output."""
+
+    def run_git(*args):
+        return subprocess.run(
+            ["git", *args], check=True, stdout=subprocess.PIPE, text=True
+        ).stdout
+
+    return run_git
+
+
+@pytest.fixture
+def commit(run_git, monkeypatch):
+    """Stage everything and commit it as if in ``year``."""
+
+    def commit(year, message="commit"):
+        date = f"{year}-06-01T12:00:00+0000"
+        monkeypatch.setenv("GIT_AUTHOR_DATE", date)
+        monkeypatch.setenv("GIT_COMMITTER_DATE", date)
+        try:
+            run_git("add", "-A")
+            run_git("commit", "-q", "-m", message)
+        finally:
+            monkeypatch.delenv("GIT_AUTHOR_DATE")
+            monkeypatch.delenv("GIT_COMMITTER_DATE")
+
+    return commit
+
+
+@pytest.fixture
+def run_hook(repo):
+    """Run a hook end to end in a new interpreter, as pre-commit does."""
+
+    def run_hook(hook, *args):
+        return subprocess.run(
+            [sys.executable, "-m", "rapids_pre_commit_hooks", hook, *args],
+            env=hook_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    return run_hook
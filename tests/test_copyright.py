@@ -0,0 +1,189 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from conftest import CURRENT_YEAR
+
+from rapids_pre_commit_hooks import copyright, git
+from rapids_pre_commit_hooks.syntax import BY_FILENAME, BY_SUFFIX
+
+
+@pytest.mark.parametrize(
+    "filename", [f"file{suffix}" for suffix in BY_SUFFIX] + list(BY_FILENAME)
+)
+def test_files_with_known_syntax_are_checked(repo, run_hook, filename):
+    (repo / filename).write_text("text\n")
+    result = run_hook("copyright-checker", "--no-cache", filename)
+    assert result.returncode == 1
+    assert result.stdout == f"{filename}:1: no copyright notice found\n"
+
+
+def test_scripts_are_checked_by_interpreter(repo, run_hook):
+    (repo / "script").write_text("#!/usr/bin/env python3\nprint()\n")
+    result = run_hook("copyright-checker", "--no-cache", "script")
+    assert result.stdout == "script:1: no copyright notice found\n"
+
+
+@pytest.mark.parametrize("hook", ["copyright-checker", "license-header-checker"])
+def test_files_with_unknown_syntax_are_passed(repo, run_hook, hook):
+    for filename in ("README.md", "data.json", "script"):
+        (repo / filename).write_text("text\n")
+    result = run_hook(hook, "README.md", "data.json", "script")
+    assert (result.returncode, result.stdout) == (0, "")
+
+
+def notice(year, leader="#"):
+    return f"{leader} Copyright (c) {year}, NVIDIA CORPORATION.\n"
+
+
+@pytest.mark.parametrize("max_pathspecs", [1, git.MAX_PATHSPECS])
+def test_expected_years(repo, commit, monkeypatch, max_pathspecs):
+    # With a limit of 1, the batch is too large for pathspecs, and the whole
+    # history is walked instead.
+    monkeypatch.setattr(git, "MAX_PATHSPECS", max_pathspecs)
+    for name in ("old.py", "edited.py", "changed.py"):
+        (repo / name).write_text(notice(2019))
+    commit(2019)
+    (repo / "edited.py").write_text(notice(2019) + "x = 1\n")
+    commit(2021)
+    (repo / "changed.py").write_text(notice(2019) + "x = 2\n")
+    (repo / "untracked.py").write_text(notice(2019))
+
+    filenames = ["old.py", "edited.py", "changed.py", "untracked.py"]
+    assert copyright.expected_years(filenames, {"changed.py"}) == {
+        "old.py": 2019,
+        "edited.py": 2021,
+        "changed.py": CURRENT_YEAR,
+        "untracked.py": CURRENT_YEAR,
+    }
+
+
+def test_last_change_years_stops_at_missing_paths(repo, commit):
+    (repo / "a.py").write_text("a\n")
+    commit(2020)
+    assert git.last_change_years({"a.py", "missing.py"}) == {"a.py": 2020}
+
+
+def test_last_change_years_follows_committed_moves(repo, commit, run_git):
+    (repo / "a.py").write_text("a\n")
+    (repo / "edited.py").write_text("edited\n")
+    commit(2019)
+    run_git("mv", "a.py", "b.py")
+    commit(2020)
+    run_git("mv", "b.py", "c.py")
+    run_git("mv", "edited.py", "moved.py")
+    (repo / "moved.py").write_text("moved and edited\n")
+    (repo / "new.py").write_text("new\n")
+    commit(2021)
+    assert git.last_change_years({"c.py", "moved.py", "new.py"}) == {
+        "c.py": 2019,
+        "moved.py": 2021,
+        "new.py": 2021,
+    }
+
+
+def test_committed_moves_keep_their_years(repo, commit, run_git, run_hook):
+    (repo / "a.py").write_text(notice(2021))
+    commit(2021)
+    run_git("checkout", "-q", "-b", "feature")
+    run_git("mv", "a.py", "b.py")
+    commit(CURRENT_YEAR)
+
+    result = run_hook("copyright-checker", "--no-cache", "b.py")
+    assert (result.returncode, result.stdout) == (0, "")
+    result = run_hook(
+        "copyright-checker", "--no-cache", "--target-branch", "main", "b.py"
+    )
+    assert (result.returncode, result.stdout) == (0, "")
+
+
+def test_staged_ignores_unstaged_changes(repo, commit, run_git, run_hook):
+    (repo / "a.py").write_text(notice(2021))
+    commit(2021)
+    (repo / "a.py").write_text(notice(2021) + "x = 1\n")
+
+    result = run_hook("copyright-checker", "--staged", "--no-cache", "a.py")
+    assert (result.returncode, result.stdout) == (0, "")
+    result = run_hook("copyright-checker", "--no-cache", "a.py")
+    assert result.stdout == "a.py:1: copyright is out of date\n"
+
+    run_git("add", "a.py")
+    result = run_hook("copyright-checker", "--staged", "--no-cache", "a.py")
+    assert result.stdout == "a.py:1: copyright is out of date\n"
+
+
+def test_staged_checks_the_index_content(repo, commit, run_git, run_hook):
+    (repo / "a.py").write_text("x = 1\n")
+    run_git("add", "a.py")
+    # Only the working tree carries a notice.
+    (repo / "a.py").write_text(notice(CURRENT_YEAR) + "x = 1\n")
+    assert run_hook("copyright-checker", "--no-cache", "a.py").returncode == 0
+    result = run_hook("copyright-checker", "--staged", "--no-cache", "a.py")
+    assert result.stdout == "a.py:1: no copyright notice found\n"
+
+
+def test_fix(repo, commit, run_hook):
+    (repo / "stale.py").write_text(notice(2019) + "x = 1\n")
+    (repo / "current.py").write_text(notice(CURRENT_YEAR))
+    (repo / "script.sh").write_text("#!/bin/sh\necho\n")
+    (repo / "main.cpp").write_text("int main() {}\n")
+
+    filenames = ["stale.py", "current.py", "script.sh", "main.cpp"]
+    result = run_hook("copyright-checker", "--fix", "--no-cache", *filenames)
+    assert result.returncode == 1
+    assert (repo / "stale.py").read_text() == (
+        f"# Copyright (c) 2019-{CURRENT_YEAR}, NVIDIA CORPORATION.\nx = 1\n"
+    )
+    assert (repo / "current.py").read_text() == notice(CURRENT_YEAR)
+    assert (repo / "script.sh").read_text() == (
+        f"#!/bin/sh\n{notice(CURRENT_YEAR)}echo\n"
+    )
+    assert (repo / "main.cpp").read_text() == (
+        f"{notice(CURRENT_YEAR, '//')}int main() {{}}\n"
+    )
+
+    # Once fixed, every file passes.
+    result = run_hook("copyright-checker", "--no-cache", *filenames)
+    assert (result.returncode, result.stdout) == (0, "")
+
+
+def test_third_party_notices_are_left_alone(repo, commit, run_hook):
+    (repo / "vendored.py").write_text("# Copyright 2010 The Example Authors\n")
+    (repo / "LICENSE").write_text("Copyright 2018 NVIDIA Corporation\n")
+    commit(2019)
+    result = run_hook("copyright-checker", "--no-cache", "vendored.py", "LICENSE")
+    assert result.stdout == "LICENSE:1: copyright is out of date\n"
+
+
+def test_target_branch_only_checks_changed_files(repo, commit, run_git, run_hook):
+    (repo / "a.py").write_text("x = 1\n")
+    (repo / "b.py").write_text("x = 1\n")
+    commit(2019)
+    run_git("checkout", "-q", "-b", "feature")
+    (repo / "b.py").write_text("x = 2\n")
+    commit(CURRENT_YEAR)
+
+    result = run_hook(
+        "copyright-checker", "--no-cache", "--target-branch", "main", "a.py", "b.py"
+    )
+    assert result.stdout == "b.py:1: no copyright notice found\n"
+
+
+def test_target_branch_without_merge_base(repo, commit, run_hook):
+    (repo / "a.py").write_text(notice(2019))
+    commit(2019)
+    result = run_hook("copyright-checker", "--target-branch", "nosuch", "a.py")
+    assert result.returncode == 2
+    assert "--target-branch: no merge base with nosuch" in result.stderr
+    assert "Traceback" not in result.stderr
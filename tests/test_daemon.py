@@ -0,0 +1,111 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+from conftest import hook_env
+
+from rapids_pre_commit_hooks import daemon
+
+
+@pytest.fixture
+def runtime_dir(monkeypatch):
+    # Socket paths are limited to around 100 bytes, too few for tmp_path.
+    with tempfile.TemporaryDirectory() as path:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", path)
+        yield path
+
+
+@pytest.fixture
+def start_daemon(repo, runtime_dir):
+    """Start a daemon for ``repo``, and wait until it is listening."""
+    processes = []
+
+    def start_daemon(*args):
+        env = hook_env()
+        env["XDG_RUNTIME_DIR"] = runtime_dir
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "rapids_pre_commit_hooks.daemon", *args],
+            env=env,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        processes.append(proc)
+        path = daemon.socket_path()
+        deadline = time.monotonic() + 30
+        while not os.path.exists(path) and proc.poll() is None:
+            assert time.monotonic() < deadline, "the daemon did not start"
+            time.sleep(0.05)
+        return proc
+
+    yield start_daemon
+    for proc in processes:
+        proc.terminate()
+        proc.wait()
+
+
+def test_forward_without_daemon(repo, runtime_dir):
+    assert daemon.forward("copyright-checker", []) is None
+
+
+def test_forward(repo, runtime_dir, start_daemon, capsys):
+    (repo / "a.py").write_text("x = 1\n")
+    start_daemon()
+    assert daemon.forward("copyright-checker", ["--no-cache", "a.py"]) == 1
+    assert capsys.readouterr().out == "a.py:1: no copyright notice found\n"
+
+
+def test_requests_are_handled_concurrently(repo, runtime_dir, start_daemon, capsys):
+    start_daemon()
+    # A client that never sends its request occupies one connection.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+        stalled.connect(daemon.socket_path())
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(daemon.forward("check-versions", []))
+        )
+        thread.start()
+        thread.join(30)
+        assert results == [0]
+
+
+def test_daemon_exits_when_idle(repo, runtime_dir, start_daemon):
+    proc = start_daemon("--idle-timeout", "0.5")
+    assert proc.wait(30) == 0
+    # The socket is removed, so hooks run in-process again.
+    assert not os.path.exists(daemon.socket_path())
+    assert daemon.forward("copyright-checker", []) is None
+
+
+def test_non_private_directory_is_refused(repo, runtime_dir, start_daemon):
+    directory = os.path.dirname(daemon.socket_path())
+    os.mkdir(directory, 0o755)
+    proc = start_daemon()
+    assert proc.wait(30) == 1
+    assert "is not private to this user" in proc.stderr.read()
+    with pytest.raises(PermissionError):
+        daemon.serve(daemon.socket_path())
+
+
+def test_client_refuses_non_private_directory(repo, runtime_dir, start_daemon):
+    start_daemon()
+    os.chmod(os.path.dirname(daemon.socket_path()), 0o755)
+    assert daemon.forward("copyright-checker", []) is None
@@ -0,0 +1,153 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import yaml
+
+from rapids_pre_commit_hooks.dependencies import Output, compare, outputs
+
+CONFIG = yaml.safe_load(
+    """
+files:
+  all:
+    output: [conda, pyproject]
+    matrix:
+      cuda: ["11.8", "12.0"]
+    includes: [build, test]
+    pyproject_dir: python/pkg
+  test:
+    output: pyproject
+    includes: [test]
+    extras:
+      table: project.optional-dependencies
+      key: test
+channels: [rapidsai, conda-forge]
+dependencies:
+  build:
+    common:
+      - output_types: [conda, pyproject]
+        packages: [numpy]
+    specific:
+      - output_types: conda
+        matrices:
+          - matrix: {cuda: "11.*"}
+            packages: [cudatoolkit]
+          - matrix:
+            packages: [cuda-version]
+  test:
+    common:
+      - output_types: conda
+        packages:
+          - pytest
+          - pip:
+              - pytest-benchmark
+      - output_types: pyproject
+        packages: [pytest]
+"""
+)
+
+
+def test_outputs():
+    conda = ["numpy", "pytest", {"pip": ["pytest-benchmark"]}]
+    channels = ["rapidsai", "conda-forge"]
+    assert outputs(CONFIG, "ci") == [
+        Output(
+            "ci/conda/environments/all_cuda-118.yaml",
+            "conda",
+            ["dependencies"],
+            ["numpy", "cudatoolkit", *conda[1:]],
+            channels,
+        ),
+        Output(
+            "ci/python/pkg/pyproject.toml",
+            "pyproject",
+            ["project", "dependencies"],
+            ["numpy", "pytest"],
+        ),
+        Output(
+            "ci/conda/environments/all_cuda-120.yaml",
+            "conda",
+            ["dependencies"],
+            # No matrix matches 12.0 but the fallback.
+            ["numpy", "cuda-version", *conda[1:]],
+            channels,
+        ),
+        Output(
+            "ci/python/pkg/pyproject.toml",
+            "pyproject",
+            ["project", "dependencies"],
+            ["numpy", "pytest"],
+        ),
+        Output(
+            "ci/pyproject.toml",
+            "pyproject",
+            ["project", "optional-dependencies", "test"],
+            ["pytest"],
+        ),
+    ]
+
+
+@pytest.fixture
+def conda_output():
+    return outputs(CONFIG)[0]
+
+
+def test_compare_matching(conda_output):
+    tree = {
+        "channels": ["rapidsai", "conda-forge"],
+        "dependencies": [
+            "cudatoolkit",
+            {"pip": ["pytest-benchmark"]},
+            "numpy",
+            "pytest",
+        ],
+    }
+    assert compare(conda_output, tree, "dependencies.yaml") == []
+
+
+def test_compare_differing(conda_output):
+    path = "conda/environments/all_cuda-118.yaml"
+    tree = {
+        "channels": ["conda-forge"],
+        "dependencies": ["cudatoolkit", "numpy", "scipy", {"pip": ["pytest"]}],
+    }
+    assert compare(conda_output, tree, "dependencies.yaml") == [
+        f"{path}: dependencies lacks pip::pytest-benchmark from dependencies.yaml",
+        f"{path}: dependencies lacks pytest from dependencies.yaml",
+        f"{path}: dependencies has pip::pytest, not in dependencies.yaml",
+        f"{path}: dependencies has scipy, not in dependencies.yaml",
+        f"{path}: channels differ from dependencies.yaml",
+    ]
+
+
+def test_compare_missing_file(conda_output):
+    assert compare(conda_output, None, "dependencies.yaml") == [
+        "conda/environments/all_cuda-118.yaml: missing, but generated from "
+        "dependencies.yaml"
+    ]
+
+
+@pytest.mark.parametrize(
+    "filename, content",
+    [("dependencies.yaml", "files: [\n"), ("pyproject.toml", "[project\n")],
+)
+def test_unparsable_files(repo, run_hook, filename, content):
+    (repo / "dependencies.yaml").write_text(
+        "files:\n  all:\n    output: pyproject\n    includes: []\n"
+    )
+    (repo / filename).write_text(content)
+    result = run_hook("check-dependencies", "--no-cache", filename)
+    assert result.returncode == 1
+    assert result.stdout.startswith(f"{filename}: could not parse: ")
+    assert result.stderr == ""
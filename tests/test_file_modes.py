@@ -0,0 +1,94 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+import rapids_pre_commit_hooks
+
+HOOKS_YAML = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ".pre-commit-hooks.yaml",
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository with a regular file, and symlinks within and out of it."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    (path / "file.txt").write_text("text\n")
+    os.symlink("file.txt", path / "inside")
+    os.symlink("../outside", path / "outside")
+    subprocess.run(["git", "add", "-A"], cwd=path, check=True)
+    return path
+
+
+def run_hook(repo, *args):
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(rapids_pre_commit_hooks.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, "-m", "rapids_pre_commit_hooks", "check-file-modes", *args],
+        cwd=repo,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def selected_by_pre_commit(hook_id, paths):
+    """The ``paths`` that pre-commit passes to a hook, by its type filters."""
+    identify = pytest.importorskip("identify.identify")
+    with open(HOOKS_YAML) as f:
+        hook = next(h for h in yaml.safe_load(f) if h["id"] == hook_id)
+    types = set(hook.get("types", ["file"]))
+    types_or = set(hook.get("types_or", []))
+    selected = []
+    for path in paths:
+        tags = identify.tags_from_path(path)
+        if types <= tags and (not types_or or types_or & tags):
+            selected.append(path)
+    return selected
+
+
+def test_pre_commit_passes_symlinks(repo):
+    paths = [str(repo / name) for name in ("file.txt", "inside", "outside")]
+    assert selected_by_pre_commit("check-file-modes", paths) == paths
+
+
+def test_symlink_out_of_repository(repo):
+    result = run_hook(repo, "file.txt", "inside", "outside")
+    assert result.returncode == 1
+    assert (
+        result.stdout
+        == "outside: symlink to ../outside points outside the repository\n"
+    )
+
+
+def test_forbidden_symlinks(repo):
+    result = run_hook(repo, "--symlinks", "forbid", "file.txt", "inside")
+    assert result.returncode == 1
+    assert result.stdout == "inside: symlinks are not allowed\n"
+
+
+def test_allowed_symlinks(repo):
+    result = run_hook(repo, "--symlinks", "allow", "file.txt", "inside", "outside")
+    assert result.returncode == 0
+    assert result.stdout == ""
@@ -0,0 +1,125 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+
+import pytest
+
+from rapids_pre_commit_hooks import fix
+from rapids_pre_commit_hooks.fix import Edit, apply_all, apply_edits
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            True,
+            id="sendfile",
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"),
+                reason="sendfile() only copies between regular files on Linux",
+            ),
+        ),
+        pytest.param(False, id="read-write"),
+    ]
+)
+def copy_path(request, monkeypatch):
+    """Run each test with both ways of copying unchanged bytes."""
+    monkeypatch.setattr(fix, "_USE_SENDFILE", request.param)
+
+
+def write(path, content, mode=0o644):
+    path.write_bytes(content)
+    os.chmod(path, mode)
+    return str(path)
+
+
+def test_edits(tmp_path, copy_path):
+    filename = write(tmp_path / "a.py", b"# Copyright (c) 2019, NVIDIA\nx = 1\n")
+    edits = [Edit(16, 20, b"2019-2026"), Edit(29, 29, b"# inserted\n")]
+    assert apply_edits(filename, edits)
+    with open(filename, "rb") as f:
+        assert f.read() == b"# Copyright (c) 2019-2026, NVIDIA\n# inserted\nx = 1\n"
+
+
+def test_edits_are_applied_in_order(tmp_path, copy_path):
+    filename = write(tmp_path / "a.txt", b"abcdef")
+    assert apply_edits(filename, [Edit(4, 5, b"E"), Edit(0, 1, b"A")])
+    with open(filename, "rb") as f:
+        assert f.read() == b"AbcdEf"
+
+
+def test_large_file(tmp_path, copy_path):
+    # Larger than a single read of the read/write copy
+    content = bytes(range(256)) * (3 << 12)
+    filename = write(tmp_path / "large.bin", content)
+    end = len(content) - 1
+    assert apply_edits(filename, [Edit(1, 2, b"x"), Edit(end, end, b"y")])
+    with open(filename, "rb") as f:
+        assert f.read() == content[:1] + b"x" + content[2:end] + b"y" + content[end:]
+
+
+def test_no_op_edits_are_dropped(tmp_path, copy_path):
+    filename = write(tmp_path / "a.txt", b"2026\n")
+    before = os.stat(filename)
+    assert not apply_edits(filename, [Edit(0, 4, b"2026")])
+    after = os.stat(filename)
+    # The file was not replaced at all.
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_no_op_edits_are_dropped_among_others(tmp_path, copy_path):
+    filename = write(tmp_path / "a.txt", b"abc")
+    assert apply_edits(filename, [Edit(0, 1, b"a"), Edit(2, 3, b"C")])
+    with open(filename, "rb") as f:
+        assert f.read() == b"abC"
+
+
+def test_overlapping_edits(tmp_path, copy_path):
+    filename = write(tmp_path / "a.txt", b"abcdef")
+    with pytest.raises(ValueError, match="overlapping edits"):
+        apply_edits(filename, [Edit(0, 3, b"x"), Edit(2, 4, b"y")])
+    with open(filename, "rb") as f:
+        assert f.read() == b"abcdef"
+    assert os.listdir(tmp_path) == ["a.txt"]
+
+
+@pytest.mark.parametrize("mode", [0o600, 0o644, 0o755])
+def test_mode_is_preserved(tmp_path, copy_path, mode):
+    filename = write(tmp_path / "a.sh", b"old\n", mode)
+    assert apply_edits(filename, [Edit(0, 3, b"new")])
+    assert stat.S_IMODE(os.stat(filename).st_mode) == mode
+    # No temporary file is left behind.
+    assert os.listdir(tmp_path) == ["a.sh"]
+
+
+def test_symlinks_are_followed(tmp_path, copy_path):
+    target = write(tmp_path / "target.txt", b"old\n")
+    os.symlink("target.txt", tmp_path / "link.txt")
+    assert apply_edits(str(tmp_path / "link.txt"), [Edit(0, 3, b"new")])
+    assert os.path.islink(tmp_path / "link.txt")
+    with open(target, "rb") as f:
+        assert f.read() == b"new\n"
+
+
+def test_apply_all(tmp_path, copy_path):
+    changed = write(tmp_path / "changed.txt", b"old\n")
+    unchanged = write(tmp_path / "unchanged.txt", b"same\n")
+    edits = {
+        changed: [Edit(0, 3, b"new")],
+        unchanged: [Edit(0, 4, b"same")],
+        str(tmp_path / "no-edits.txt"): [],
+    }
+    assert apply_all(edits) == [changed]
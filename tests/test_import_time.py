@@ -0,0 +1,75 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import rapids_pre_commit_hooks
+from rapids_pre_commit_hooks import cli
+
+# Hook name -> most seconds that importing the console script entry point and
+# the hook's own module may take. These are about three times what they take
+# on a developer machine, so they only catch imports that are far too heavy,
+# such as a hook pulling in a large dependency at the top level.
+BUDGETS = {
+    "check-dependencies": 0.1,
+    "check-file-modes": 0.1,
+    "check-large-blobs": 0.1,
+    "check-versions": 0.1,
+    "copyright-checker": 0.15,
+    "license-header-checker": 0.15,
+    "rapids-check": 0.15,
+}
+
+# Runs per hook, of which the fastest counts, to ride out a noisy machine
+RUNS = 3
+
+
+def import_time(modules):
+    """Cumulative import time of ``modules`` as reported by ``-X importtime``."""
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(rapids_pre_commit_hooks.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] in modules:
+            times[fields[2]] = int(fields[1]) / 1e6
+    assert set(times) == set(modules), stderr
+    return sum(times.values())
+
+
+def test_every_hook_has_a_budget():
+    assert set(BUDGETS) == set(cli.HOOKS)
+
+
+@pytest.mark.parametrize("hook", sorted(cli.HOOKS))
+def test_import_time(hook):
+    module = cli.HOOKS[hook].partition(":")[0]
+    modules = ["rapids_pre_commit_hooks.cli", module]
+    best = min(import_time(modules) for _ in range(RUNS))
+    assert best <= BUDGETS[hook], (
+        f"importing {hook} took {best * 1000:.0f} ms, "
+        f"more than its {BUDGETS[hook] * 1000:.0f} ms budget"
+    )
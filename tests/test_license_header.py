@@ -0,0 +1,81 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from rapids_pre_commit_hooks.license_header import check_content, render
+
+NOTICE = b"# Copyright (c) 2026, NVIDIA CORPORATION.\n#\n"
+
+
+def warnings(content):
+    found, edits = check_content("file", content)
+    assert edits == []
+    return [(w.line, w.message) for w in found]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(NOTICE + render("#") + b"\nx = 1\n", id="hash"),
+        pytest.param(b"// Notice\n//\n" + render("//") + b"int x;\n", id="slashes"),
+        pytest.param(b"/*\n" + render(" *") + b" */\n", id="block-continuation"),
+        pytest.param(b"/*\n" + render("") + b"*/\n", id="block"),
+        pytest.param((NOTICE + render("#")).replace(b"\n", b"\r\n"), id="crlf"),
+        pytest.param(NOTICE + render("#").replace(b"\n", b"  \n"), id="whitespace"),
+    ],
+)
+def test_unmodified_headers(content):
+    assert warnings(content) == []
+
+
+def test_missing_header():
+    assert warnings(b"x = 1\n") == [(1, "no Apache-2.0 license header found")]
+
+
+def test_modified_line():
+    content = NOTICE + render("#").replace(b'"AS IS"', b'"AS-IS"')
+    assert warnings(content) == [
+        (
+            10,
+            "license header differs from the Apache-2.0 text: expected "
+            "'distributed under the License is distributed on an \"AS IS\" BASIS,', "
+            'found \'distributed under the License is distributed on an "AS-IS" '
+            "BASIS,'",
+        )
+    ]
+
+
+@pytest.mark.parametrize("rest", [b"", b"x = 1\n"], ids=["at-eof", "before-code"])
+def test_truncated_header(rest):
+    header = b"".join(render("#").splitlines(keepends=True)[:4])
+    (line, message), *others = warnings(NOTICE + header + rest)
+    assert (line, others) == (7, [])
+    assert message.startswith(
+        "license header differs from the Apache-2.0 text: "
+        "expected 'http://www.apache.org/licenses/LICENSE-2.0'"
+    )
+
+
+@pytest.mark.parametrize("filename", ["LICENSE", "NOTICE.md", "COPYING.txt"])
+def test_license_files_are_excluded(repo, run_hook, filename):
+    (repo / filename).write_text("Apache License\n")
+    result = run_hook("license-header-checker", "--no-cache", filename)
+    assert (result.returncode, result.stdout) == (0, "")
+
+
+def test_source_named_license_is_checked(repo, run_hook):
+    (repo / "license.py").write_text("x = 1\n")
+    result = run_hook("license-header-checker", "--no-cache", "license.py")
+    assert result.stdout == "license.py:1: no Apache-2.0 license header found\n"
@@ -0,0 +1,84 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+
+import pytest
+
+from rapids_pre_commit_hooks import lines
+from rapids_pre_commit_hooks.lines import LineIndex
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Run each test with every scan using NumPy, and with none using it."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(lines, "NUMPY_MIN_SCAN", 0)
+    else:
+        monkeypatch.setattr(lines, "_numpy", lambda: None)
+
+
+def reference(content, offset):
+    return content.count(b"\n", 0, offset) + 1
+
+
+CONTENT = b"".join(b"line %d\n" % n for n in range(1, 5001)) + b"last"
+
+
+def test_line(backend):
+    index = LineIndex(CONTENT)
+    for offset in (0, 6, 7, 8, 4095, 4096, 20000, len(CONTENT) - 1, len(CONTENT)):
+        assert index.line(offset) == reference(CONTENT, offset)
+
+
+def test_lines(backend):
+    offsets = [len(CONTENT) - 1, 0, 7, 12345, 7]
+    assert LineIndex(CONTENT).lines(offsets) == [reference(CONTENT, o) for o in offsets]
+    assert LineIndex(CONTENT).lines([7]) == [2]
+    assert LineIndex(CONTENT).lines([]) == []
+
+
+def test_start_and_end(backend):
+    index = LineIndex(CONTENT)
+    assert (index.start(1), index.end(1)) == (0, 7)
+    assert CONTENT[index.start(4000) : index.end(4000)] == b"line 4000\n"
+    assert CONTENT[index.start(5001) : index.end(5001)] == b"last"
+    assert index.start(6000) == len(CONTENT)
+
+
+def test_header_only_is_indexed(backend):
+    index = LineIndex(CONTENT)
+    assert index.line(100) == reference(CONTENT, 100)
+    assert index._scanned == lines.MIN_SCAN
+    # Each later scan at least doubles the part scanned so far.
+    index.line(lines.MIN_SCAN + 1)
+    assert index._scanned == 2 * lines.MIN_SCAN
+
+
+@pytest.mark.parametrize("content", [b"", b"\n", b"no newline", b"\n\n\n"])
+def test_edge_cases(backend, content):
+    index = LineIndex(content)
+    for offset in range(len(content) + 1):
+        assert index.line(offset) == reference(content, offset)
+    assert index.start(content.count(b"\n") + 2) == len(content)
+
+
+def test_mmap(backend, tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(CONTENT)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        index = LineIndex(m)
+        assert index.lines([0, len(CONTENT) - 1]) == [1, 5001]
+        assert m[index.start(2) : index.end(2)] == b"line 2\n"
@@ -0,0 +1,55 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from rapids_pre_commit_hooks.versions import VersionLiteral, scan_pyproject
+
+
+def scan(text):
+    return list(scan_pyproject("pyproject.toml", text.splitlines(keepends=True)))
+
+
+def test_pyproject():
+    assert scan(
+        '[build-system]\nrequires = ["setuptools"]\n\n'
+        '[project]\nname = "pkg"\nversion = "24.02.00"\n'
+    ) == [VersionLiteral("pyproject.toml", 6, "pkg", "24.02.00")]
+
+
+@pytest.mark.parametrize(
+    "header", ["[tool.pkg]", "[[tool.pkg.plugins]]", "[ tool.pkg ]  # comment"]
+)
+def test_project_table_ends_at_any_header(header):
+    assert scan(
+        f'[project]\nname = "pkg"\nversion = "1.0"\n{header}\nversion = "2.0"\n'
+    ) == [VersionLiteral("pyproject.toml", 3, "pkg", "1.0")]
+
+
+def test_array_of_tables_before_project():
+    assert scan(
+        '[[tool.pkg.plugins]]\nname = "plugin"\nversion = "2.0"\n'
+        '[project]\nname = "pkg"\nversion = "1.0"\n'
+    ) == [VersionLiteral("pyproject.toml", 6, "pkg", "1.0")]
+
+
+def test_multi_line_arrays_stay_in_project():
+    assert scan(
+        '[project]\nname = "pkg"\nclassifiers = [\n    ["nested"],\n]\n'
+        'version = "1.0"\n'
+    ) == [VersionLiteral("pyproject.toml", 6, "pkg", "1.0")]
+
+
+def test_dynamic_version_is_skipped():
+    assert scan('[project]\nname = "pkg"\ndynamic = ["version"]\n') == []